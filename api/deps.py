@@ -91,6 +91,11 @@ def get_workflow_service():
     return g.workflow_service
 
 
+def get_emotion_service():
+    """Get the emotion service instance."""
+    return g.emotion_service
+
+
 def get_metrics_service():
     """Get the metrics service instance."""
     return g.metrics_service
@@ -138,6 +143,7 @@ __all__ = [
     "get_audio_service",
     "get_alarm_service",
     "get_wake_service",
+    "get_emotion_service",
     "get_workflow_service",
     "get_metrics_service",
     "get_agent_session",
@@ -14,7 +14,7 @@ from pydantic import BaseModel
 from typing import Optional
 import logging
 
-from api.deps import get_animation_service
+from api.deps import get_animation_service, get_emotion_service
 from lelamp.user_data import (
     list_all_recordings,
     get_recording_path,
@@ -305,6 +305,13 @@ async def stop_recording():
 
         logging.info(f"Saved recording to: {csv_path}")
 
+        animation_service = get_animation_service()
+        if animation_service:
+            animation_service.invalidate_recordings_cache()
+        emotion_service = get_emotion_service()
+        if emotion_service:
+            emotion_service.refresh_recording_map()
+
         frame_count = len(_recording_data)
         duration = frame_count / 30.0
         name = _recording_name
@@ -426,8 +433,13 @@ async def delete_animation(name: str):
 
         # Clear from cache if animation service has it cached
         animation_service = get_animation_service()
-        if animation_service and name in animation_service._recording_cache:
-            del animation_service._recording_cache[name]
+        if animation_service:
+            animation_service.invalidate_recordings_cache()
+            if name in animation_service._recording_cache:
+                del animation_service._recording_cache[name]
+        emotion_service = get_emotion_service()
+        if emotion_service:
+            emotion_service.refresh_recording_map()
 
         return {
             "success": True,
@@ -76,14 +76,8 @@ async def update_music_modifier(data: MusicModifierUpdate):
         if not music_mod:
             return {"success": False, "error": "Music modifier not found"}
 
-        if data.amplitude is not None:
-            music_mod.set_amplitude(data.amplitude)
-
-        if data.beat_divisor is not None:
-            music_mod.set_beat_divisor(data.beat_divisor)
-
-        if data.groove is not None:
-            music_mod.set_groove(data.groove)
+        # One config swap, so the animation thread never sees a half-applied update
+        music_mod.set_params(amplitude=data.amplitude, beat_divisor=data.beat_divisor, groove=data.groove)
 
         if data.joints is not None:
             music_mod.update_target_joints(set(data.joints))
@@ -0,0 +1,41 @@
+import argparse
+import json
+import sys
+
+from lelamp.service.emotion import EmotionService
+
+
+def classify_emotions(input_path: str, model: str, poll_interval: float):
+    """Classify every transcript line in a file through Gemini Batch Mode."""
+    with open(input_path, 'r') as f:
+        texts = [line.strip() for line in f if line.strip()]
+
+    if not texts:
+        print("No transcripts found", file=sys.stderr)
+        return
+
+    service = EmotionService(model=model, auto_react=False)
+    print(f"Submitting {len(texts)} transcripts (batch jobs can take up to 24 hours)...", file=sys.stderr)
+    results = service.classify_batch_offline(texts, poll_interval=poll_interval)
+
+    for text, result in zip(texts, results):
+        print(json.dumps({
+            "text": text,
+            "emotion": result["emotion_str"] if result else None,
+            "confidence": result["confidence"] if result else None,
+            "reasoning": result["reasoning"] if result else None,
+        }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Classify stored transcripts for emotion using Gemini Batch Mode")
+    parser.add_argument("input", help="Text file with one transcript per line")
+    parser.add_argument("--model", default="gemini-1.5-flash", help="Gemini model name")
+    parser.add_argument("--poll-interval", type=float, default=30.0, help="Seconds between job status checks")
+    args = parser.parse_args()
+
+    classify_emotions(args.input, args.model, args.poll_interval)
+
+
+if __name__ == "__main__":
+    main()
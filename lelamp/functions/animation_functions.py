@@ -6,21 +6,66 @@ This module contains all animation-related function tools including:
 - Playing movement recordings
 """
 
+import asyncio
 import logging
 import random
+from typing import Optional
 from lelamp.service.agent.tools import Tool
 
+logger = logging.getLogger(__name__)
+
+# Fixed tool replies
+_MSG_NO_RECORDINGS = "No recordings found."
+_MSG_DANCE_OFF = "Okay, I'll stop dancing to the music."
+_MSG_DANCE_ON = "Let's groove! I'm feeling the beat now."
+_MSG_DANCE_UNAVAILABLE = "Dance mode not available"
+
+# Dance intensity -> (amplitude in degrees, beat divisor, reply)
+_INTENSITY_TABLE = {
+    "subtle": (5.0, 2.0, "Okay, keeping it subtle and chill."),  # Every 2 beats - slower
+    "normal": (10.0, 1.0, "Back to normal vibes!"),  # Every beat
+    "energetic": (15.0, 1.0, "Feeling energetic! Let's go!"),  # Every beat, bigger movement
+    "crazy": (20.0, 0.5, "PARTY MODE ACTIVATED!"),  # Twice per beat!
+}
+
 
 class AnimationFunctions:
     """Mixin class providing animation/movement function tools"""
 
-    def _check_animation_enabled(self) -> str:
+    # Cached result of the availability check, recomputed when animation_service or
+    # motors_enabled are assigned so tools don't re-probe attributes on every call
+    _anim_enabled_err: Optional[str] = "Animation is not available - animation service not initialized."
+
+    @property
+    def animation_service(self):
+        return getattr(self, '_animation_service', None)
+
+    @animation_service.setter
+    def animation_service(self, service):
+        self._animation_service = service
+        self._recompute_caps()
+
+    @property
+    def motors_enabled(self) -> bool:
+        return getattr(self, '_motors_enabled', True)
+
+    @motors_enabled.setter
+    def motors_enabled(self, enabled: bool):
+        self._motors_enabled = enabled
+        self._recompute_caps()
+
+    def _recompute_caps(self):
+        """Recompute the cached animation availability message."""
+        if not self.motors_enabled:
+            self._anim_enabled_err = "Movement is not available - running in headless mode without motor hardware."
+        elif not self.animation_service:
+            self._anim_enabled_err = "Animation is not available - animation service not initialized."
+        else:
+            self._anim_enabled_err = None
+
+    def _check_animation_enabled(self) -> Optional[str]:
         """Check if animation/motors are enabled. Returns error message if disabled, None if enabled."""
-        if not getattr(self, 'motors_enabled', True):
-            return "Movement is not available - running in headless mode without motor hardware."
-        if not getattr(self, 'animation_service', None):
-            return "Animation is not available - animation service not initialized."
-        return None
+        return self._anim_enabled_err
 
     @Tool.register_tool
     async def flip_coin(self) -> str:
@@ -38,7 +83,7 @@ class AnimationFunctions:
         if error:
             return f"Cannot flip coin with actions: {error}"
 
-        print("LeLamp: flip_coin function called")
+        logger.debug("flip_coin function called")
         
         result = random.choice(["Heads", "Tails"])
         
@@ -74,21 +119,18 @@ class AnimationFunctions:
             return error
 
         if self.is_sleeping:
-            logging.info("Blocked get_available_recordings while sleeping")
+            logger.info("Blocked get_available_recordings while sleeping")
             return ""
-        print("LeLamp: get_available_recordings function called")
+        logger.debug("get_available_recordings function called")
         try:
-            recordings = self.animation_service.get_available_recordings()
+            # Scans the user and builtin recording directories
+            recordings = await asyncio.to_thread(self.animation_service.get_available_recordings)
 
             if recordings:
-                result = f"Available recordings: {', '.join(recordings)}"
-                return result
-            else:
-                result = "No recordings found."
-                return result
+                return "Available recordings: " + ", ".join(recordings)
+            return _MSG_NO_RECORDINGS
         except Exception as e:
-            result = f"Error getting recordings: {str(e)}"
-            return result
+            return "Error getting recordings: " + str(e)
 
     @Tool.register_tool
     async def play_recording(self, recording_name: str) -> str:
@@ -107,30 +149,26 @@ class AnimationFunctions:
         if error:
             return error
 
-        print(f"LeLamp: play_recording function called with recording_name: {recording_name}")
-        logging.info(f"play_recording called: recording='{recording_name}', is_sleeping={self.is_sleeping}")
+        logger.info("play_recording called: recording='%s', is_sleeping=%s", recording_name, self.is_sleeping)
 
         # Check if manual control override is active
         # Access via animation_service instead of importing main module
-        if hasattr(self, 'animation_service') and self.animation_service:
-            if getattr(self.animation_service, 'manual_control_override', False):
-                logging.warning(f"🚫 BLOCKED animation '{recording_name}' - manual control override active")
-                return ""  # Silent - don't acknowledge to avoid interrupting manual control
+        if getattr(self.animation_service, 'manual_control_override', False):
+            logger.warning("🚫 BLOCKED animation '%s' - manual control override active", recording_name)
+            return ""  # Silent - don't acknowledge to avoid interrupting manual control
 
         # Don't animate when sleeping (except for sleep animation itself)
         if self.is_sleeping and recording_name != "sleep":
-            logging.warning(f"🚫 BLOCKED animation '{recording_name}' while sleeping - returning empty")
+            logger.warning("🚫 BLOCKED animation '%s' while sleeping - returning empty", recording_name)
             return ""  # Silent - don't acknowledge
 
         try:
             # Send play event to animation service
-            logging.info(f"Dispatching '{recording_name}' to animation service (is_sleeping={self.is_sleeping})")
+            logger.info("Dispatching '%s' to animation service (is_sleeping=%s)", recording_name, self.is_sleeping)
             self.animation_service.dispatch("play", recording_name)
-            result = f"Started playing recording: {recording_name}"
-            return result
+            return "Started playing recording: " + recording_name
         except Exception as e:
-            result = f"Error playing recording {recording_name}: {str(e)}"
-            return result
+            return f"Error playing recording {recording_name}: {e}"
 
     @Tool.register_tool
     async def stop_dancing(self) -> str:
@@ -148,12 +186,12 @@ class AnimationFunctions:
         if error:
             return error
 
-        print("LeLamp: stop_dancing function called")
+        logger.debug("stop_dancing function called")
         try:
             self.animation_service.disable_modifier("music")
-            return "Okay, I'll stop dancing to the music."
+            return _MSG_DANCE_OFF
         except Exception as e:
-            return f"Error stopping dance mode: {str(e)}"
+            return "Error stopping dance mode: " + str(e)
 
     @Tool.register_tool
     async def start_dancing(self) -> str:
@@ -170,12 +208,12 @@ class AnimationFunctions:
         if error:
             return error
 
-        print("LeLamp: start_dancing function called")
+        logger.debug("start_dancing function called")
         try:
             self.animation_service.enable_modifier("music")
-            return "Let's groove! I'm feeling the beat now."
+            return _MSG_DANCE_ON
         except Exception as e:
-            return f"Error starting dance mode: {str(e)}"
+            return "Error starting dance mode: " + str(e)
 
     @Tool.register_tool
     async def set_dance_intensity(self, intensity: str) -> str:
@@ -194,31 +232,19 @@ class AnimationFunctions:
         if error:
             return error
 
-        print(f"LeLamp: set_dance_intensity function called with intensity: {intensity}")
+        logger.debug("set_dance_intensity function called with intensity: %s", intensity)
         try:
-            intensity_lower = intensity.lower()
             music_mod = self.animation_service.get_modifier("music")
 
             if not music_mod:
-                return "Dance mode not available"
-
-            if intensity_lower == "subtle":
-                music_mod.set_amplitude(5.0)
-                music_mod.set_beat_divisor(2.0)  # Every 2 beats - slower
-                return "Okay, keeping it subtle and chill."
-            elif intensity_lower == "normal":
-                music_mod.set_amplitude(10.0)
-                music_mod.set_beat_divisor(1.0)  # Every beat
-                return "Back to normal vibes!"
-            elif intensity_lower == "energetic":
-                music_mod.set_amplitude(15.0)
-                music_mod.set_beat_divisor(1.0)  # Every beat, bigger movement
-                return "Feeling energetic! Let's go!"
-            elif intensity_lower == "crazy":
-                music_mod.set_amplitude(20.0)
-                music_mod.set_beat_divisor(0.5)  # Twice per beat!
-                return "PARTY MODE ACTIVATED!"
-            else:
+                return _MSG_DANCE_UNAVAILABLE
+
+            row = _INTENSITY_TABLE.get(intensity.lower())
+            if row is None:
                 return f"Unknown intensity '{intensity}'. Try: subtle, normal, energetic, or crazy"
+
+            amplitude, beat_divisor, message = row
+            music_mod.set_params(amplitude=amplitude, beat_divisor=beat_divisor)
+            return message
         except Exception as e:
-            return f"Error setting dance intensity: {str(e)}"
+            return "Error setting dance intensity: " + str(e)
@@ -448,14 +448,11 @@ class SensorFunctions:
                 new_yaw = max(-90, min(90, current_yaw + yaw_adjustment))
                 new_pitch = max(-45, min(45, current_pitch + pitch_adjustment))
 
-                # Send action through animation service
-                action = {
-                    'base_yaw.pos': new_yaw,
-                    'base_pitch.pos': new_pitch
-                }
-
-                with self.animation_service._bus_lock:
-                    self.animation_service.robot.send_action(action)
+                # Send both joints in one sync-write through animation service
+                self.animation_service.move_to_many({
+                    'base_yaw': new_yaw,
+                    'base_pitch': new_pitch
+                })
 
                 return "There you are! I see you now."
 
@@ -6,12 +6,102 @@ This module contains vision-related function tools including:
 - What the agent can see
 """
 
+import asyncio
 import logging
+import threading
 import cv2
-import mediapipe as mp
+from mediapipe.solutions import hands as mp_hands
 import random
 import numpy as np
 from lelamp.service.agent.tools import Tool
+from lelamp.service.camera import init_camera_service
+
+logger = logging.getLogger(__name__)
+
+# Hand landmark indices: fingertips (Index, Middle, Ring, Pinky) and their PIP joints
+_FINGER_TIPS = np.array([8, 12, 16, 20], dtype=np.intp)
+_FINGER_PIPS = np.array([6, 10, 14, 18], dtype=np.intp)
+
+# Rock, Paper, Scissors moves, the animation I play for each, and what each move beats
+_RPS_MOVES = ("Rock", "Paper", "Scissors")
+_RPS_ANIMATIONS = {
+    "Rock": "head_down",
+    "Paper": "wake_up",
+    "Scissors": "happy_wiggle",
+}
+_RPS_BEATS = {
+    "Rock": "Scissors",
+    "Paper": "Rock",
+    "Scissors": "Paper",
+}
+
+# describe_scene people summary, indexed by min(number_of_people, 2)
+_PEOPLE_SUMMARY = (
+    "I don't see anyone right now.",
+    "I see one person.",
+    "I see {count} people.",
+)
+
+# Persistent MediaPipe Hands detector, created on first use
+_HANDS = None
+_HANDS_LOCK = threading.Lock()
+
+# Palm detection cost scales with pixel count; a single hand needs far less than full resolution
+_HANDS_MAX_SIZE = 480
+_SMALL_BUF = None
+_RGB_BUF = None
+
+
+def _get_hands():
+    """Get the shared Hands detector (call with _HANDS_LOCK held)."""
+    global _HANDS
+    if _HANDS is None:
+        # Each game sees a single frame minutes after the last one, so run palm
+        # detection every call; reusing the object still skips the graph init
+        _HANDS = mp_hands.Hands(
+            static_image_mode=True,
+            max_num_hands=1,
+            model_complexity=0,  # 0=Lite, 1=Full; finger counting doesn't need Full
+            min_detection_confidence=0.5,
+            min_tracking_confidence=0.5
+        )
+    return _HANDS
+
+
+def _downscale(frame):
+    """Shrink frame so its longer side is at most _HANDS_MAX_SIZE (call with _HANDS_LOCK held)."""
+    global _SMALL_BUF
+    height, width = frame.shape[:2]
+    if max(width, height) <= _HANDS_MAX_SIZE:
+        return frame
+
+    scale = _HANDS_MAX_SIZE / max(width, height)
+    size = (int(width * scale), int(height * scale))
+    # Reuse the resize buffer across calls while the camera resolution stays the same
+    if _SMALL_BUF is None or _SMALL_BUF.shape[:2] != (size[1], size[0]):
+        _SMALL_BUF = np.empty((size[1], size[0], 3), dtype=np.uint8)
+    return cv2.resize(frame, size, dst=_SMALL_BUF, interpolation=cv2.INTER_AREA)
+
+
+def _to_rgb(frame):
+    """Convert BGR to RGB into a reused output buffer (call with _HANDS_LOCK held)."""
+    global _RGB_BUF
+    if _RGB_BUF is None or _RGB_BUF.shape != frame.shape:
+        _RGB_BUF = np.empty_like(frame)
+    return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=_RGB_BUF)
+
+
+def _detect_hands(camera):
+    """Run hand tracking on the camera's latest frame. Returns None if no frame (blocking)."""
+    frame = camera.latest_frame()
+    if frame is None:
+        return None
+
+    # Flip horizontally for a mirror view interaction (optional, but standard)
+    # frame = cv2.flip(frame, 1)
+    with _HANDS_LOCK:
+        # Landmarks are normalized to [0, 1], so no rescaling is needed afterwards
+        return _get_hands().process(_to_rgb(_downscale(frame)))
 
 
 class VisionFunctions:
@@ -34,112 +124,79 @@ class VisionFunctions:
         """
         from lelamp.globals import animation_service
 
-        print("LeLamp: play_rock_paper_scissors function called")
+        logger.debug("play_rock_paper_scissors function called")
 
         if self.is_sleeping:
             return "I'm sleeping right now. Wake me up to play!"
 
-        # Initialize MediaPipe Hands
-        mp_hands = mp.solutions.hands
-        
-        # Try to open camera
-        cap = cv2.VideoCapture(0)
-        if not cap.isOpened():
-            return "I couldn't open my eyes (camera) to see your hand. Maybe I'm already using them for something else?"
+        # Shared camera; concurrent calls reuse one open, settled device
+        camera = init_camera_service()
 
         try:
-            with mp_hands.Hands(
-                static_image_mode=True,
-                max_num_hands=1,
-                min_detection_confidence=0.5
-            ) as hands:
-                
-                # Capture a few frames to let camera settle, but just use the last one
-                for _ in range(5):
-                    ret, frame = cap.read()
-                    if not ret:
-                        break
-                
-                if not ret:
-                    return "I tried to look, but I couldn't see anything (camera error)."
-
-                # Process frame
-                # Flip horizontally for a mirror view interaction (optional, but standard)
-                # frame = cv2.flip(frame, 1) 
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                results = hands.process(rgb_frame)
-
-                if not results.multi_hand_landmarks:
-                    return "I didn't see your hand! Make sure it's in front of my camera."
-
-                # Analyze Hand Gesture
-                hand_landmarks = results.multi_hand_landmarks[0]
-                
-                # Count extended fingers (Index, Middle, Ring, Pinky)
-                # Tip (4, 8, 12, 16, 20) vs PIP (2, 6, 10, 14, 18)
-                # Note: Y increases downwards in image coordinates. 
-                # So Tip < PIP means Tip is higher (extended up).
-                
-                finger_tips = [8, 12, 16, 20]
-                finger_pips = [6, 10, 14, 18]
-                extended_fingers = 0
-                
-                for tip, pip in zip(finger_tips, finger_pips):
-                    if hand_landmarks.landmark[tip].y < hand_landmarks.landmark[pip].y:
-                        extended_fingers += 1
-
-                # Thumb is special (compare x for side-to-side, but simpler to ignore or loose check)
-                # Let's stick to the 4 main fingers for R/P/S robustness
-                
-                user_move = "Unknown"
-                if extended_fingers >= 4:
-                    user_move = "Paper"
-                elif extended_fingers == 2:
-                    # Check if it's index and middle (Scissors)
-                    # Ideally check specific fingers, but count 2 is usually scissors in this context
-                    user_move = "Scissors"
-                elif extended_fingers <= 1:
-                    user_move = "Rock"
-                else:
-                    # Ambiguous (3 fingers? Claw?) - Guess Paper or Rock?
-                    # Let's say "I'm not sure" or default to Rock
-                    user_move = "Rock" # Default to rock for loose fists
-
-                # Bot Move
-                bot_move = random.choice(["Rock", "Paper", "Scissors"])
-                
-                # Animations
-                # Rock -> head_down
-                # Paper -> wake_up
-                # Scissors -> happy_wiggle
-                anim_map = {
-                    "Rock": "head_down",
-                    "Paper": "wake_up",
-                    "Scissors": "happy_wiggle"
-                }
-                
-                # Determine Winner
-                result = "Tie"
-                if user_move == bot_move:
-                    result = "It's a Tie!"
-                elif (user_move == "Rock" and bot_move == "Scissors") or \
-                     (user_move == "Paper" and bot_move == "Rock") or \
-                     (user_move == "Scissors" and bot_move == "Paper"):
-                    result = "You Win!"
-                else:
-                    result = "I Win!"
-
-                # Play Animation
-                if animation_service:
-                    animation_service.dispatch("play", anim_map[bot_move])
-
-                return f"You showed {user_move}. I chose {bot_move} ({anim_map[bot_move]} action). {result}"
+            camera.acquire()
+
+            # Camera wait and hand inference block, keep them off the event loop
+            results = await asyncio.to_thread(_detect_hands, camera)
+            if results is None:
+                return "I couldn't open my eyes (camera) to see your hand. Maybe I'm already using them for something else?"
+
+            if not results.multi_hand_landmarks:
+                return "I didn't see your hand! Make sure it's in front of my camera."
+
+            # Analyze Hand Gesture
+            hand_landmarks = results.multi_hand_landmarks[0]
+            
+            # Count extended fingers (Index, Middle, Ring, Pinky)
+            # Note: Y increases downwards in image coordinates.
+            # So Tip < PIP means Tip is higher (extended up).
+            ys = np.fromiter(
+                (lm.y for lm in hand_landmarks.landmark),
+                dtype=np.float32,
+                count=len(hand_landmarks.landmark),
+            )
+            extended_fingers = int((ys[_FINGER_TIPS] < ys[_FINGER_PIPS]).sum())
+
+            # Thumb is special (compare x for side-to-side, but simpler to ignore or loose check)
+            # Let's stick to the 4 main fingers for R/P/S robustness
+            
+            user_move = "Unknown"
+            if extended_fingers >= 4:
+                user_move = "Paper"
+            elif extended_fingers == 2:
+                # Check if it's index and middle (Scissors)
+                # Ideally check specific fingers, but count 2 is usually scissors in this context
+                user_move = "Scissors"
+            elif extended_fingers <= 1:
+                user_move = "Rock"
+            else:
+                # Ambiguous (3 fingers? Claw?) - Guess Paper or Rock?
+                # Let's say "I'm not sure" or default to Rock
+                user_move = "Rock" # Default to rock for loose fists
+
+            # Bot Move
+            bot_move = random.choice(_RPS_MOVES)
+            bot_animation = _RPS_ANIMATIONS[bot_move]
+
+            # Determine Winner
+            if user_move == bot_move:
+                result = "It's a Tie!"
+            elif _RPS_BEATS[user_move] == bot_move:
+                result = "You Win!"
+            else:
+                result = "I Win!"
+
+            # Play Animation
+            if animation_service:
+                animation_service.dispatch("play", bot_animation)
+
+            return f"You showed {user_move}. I chose {bot_move} ({bot_animation} action). {result}"
 
         except Exception as e:
-            logging.error(f"Error in play_rock_paper_scissors: {e}")
+            logger.error("Error in play_rock_paper_scissors: %s", e)
             return f"Oops, something went wrong while playing: {str(e)}"
         finally:
-            cap.release()
+            # Closing the device joins the grabber thread
+            await asyncio.to_thread(camera.release)
 
     @Tool.register_tool
     async def describe_scene(self) -> str:
@@ -157,7 +214,7 @@ class VisionFunctions:
         """
         from lelamp.globals import ollama_vision_service
 
-        print("LeLamp: describe_scene function called")
+        logger.debug("describe_scene function called")
         try:
             # Skip vision processing when sleeping
             if self.is_sleeping:
@@ -171,49 +228,51 @@ class VisionFunctions:
             if context is None:
                 return "I haven't analyzed the scene yet. Give me a moment to look around."
 
-            # Build a natural language description
-            parts = []
+            people = context.people
+            animals = context.animals
+            objects = context.objects
+            # The vision model's JSON is passed through unvalidated; it may give null or a string
+            try:
+                number_of_people = int(context.number_of_people or 0)
+            except (TypeError, ValueError):
+                number_of_people = len(people or ())
 
-            # Environment
-            parts.append(f"I'm in what looks like {context.environment}.")
-            parts.append(f"The lighting is {context.lighting}.")
+            # Build a natural language description
+            # Environment and people summary
+            parts = [
+                f"I'm in what looks like {context.environment}.",
+                f"The lighting is {context.lighting}.",
+                _PEOPLE_SUMMARY[min(number_of_people, 2)].format(count=number_of_people),
+            ]
 
             # People
-            if context.number_of_people == 0:
-                parts.append("I don't see anyone right now.")
-            elif context.number_of_people == 1:
-                parts.append("I see one person.")
-                if context.people:
-                    person = context.people[0]
-                    desc = person.get('description', '')
-                    activity = person.get('activity', '')
+            if number_of_people == 1:
+                if people:
+                    person = people[0]
+                    desc = person.get('description')
+                    activity = person.get('activity')
                     if desc:
                         parts.append(f"They appear to be {desc}.")
                     if activity:
                         parts.append(f"They seem to be {activity}.")
-            else:
-                parts.append(f"I see {context.number_of_people} people.")
-                for i, person in enumerate(context.people, 1):
-                    desc = person.get('description', '')
+            elif number_of_people > 1:
+                for i, person in enumerate(people, 1):
+                    desc = person.get('description')
                     if desc:
                         parts.append(f"Person {i}: {desc}.")
 
             # Animals
-            if context.animals:
+            if animals:
                 animal_descs = []
-                for animal in context.animals:
-                    a_type = animal.get('type', 'animal')
-                    a_desc = animal.get('description', '')
-                    if a_desc:
-                        animal_descs.append(f"{a_type} ({a_desc})")
-                    else:
-                        animal_descs.append(a_type)
+                for animal in animals:
+                    kind = animal.get('type', 'animal')
+                    desc = animal.get('description')
+                    animal_descs.append(f"{kind} ({desc})" if desc else kind)
                 parts.append(f"I also see: {', '.join(animal_descs)}.")
 
             # Notable objects
-            if context.objects and len(context.objects) > 0:
-                obj_list = context.objects[:5]  # Limit to 5
-                parts.append(f"Notable objects: {', '.join(obj_list)}.")
+            if objects:
+                parts.append(f"Notable objects: {', '.join(objects[:5])}.")  # Limit to 5
 
             # Confidence
             if context.confidence == "low":
@@ -222,7 +281,7 @@ class VisionFunctions:
             return " ".join(parts)
 
         except Exception as e:
-            logging.error(f"Error in describe_scene: {e}")
+            logger.error("Error in describe_scene: %s", e)
             return f"Error analyzing scene: {str(e)}"
 
     @Tool.register_tool
@@ -240,7 +299,7 @@ class VisionFunctions:
         """
         from lelamp.globals import ollama_vision_service
 
-        print("LeLamp: get_scene_details function called")
+        logger.debug("get_scene_details function called")
         try:
             # Skip vision processing when sleeping
             if self.is_sleeping:
@@ -261,24 +320,31 @@ class VisionFunctions:
                 f"People count: {context.number_of_people}",
             ]
 
-            if context.people:
+            people = context.people
+            animals = context.animals
+            objects = context.objects
+            timestamp = context.timestamp
+
+            if people:
                 details.append("People details:")
-                for i, p in enumerate(context.people, 1):
-                    details.append(f"  {i}. {p.get('description', 'N/A')} - {p.get('activity', 'N/A')} - {p.get('position', 'N/A')}")
+                details.extend(
+                    f"  {i}. {p.get('description', 'N/A')} - {p.get('activity', 'N/A')} - {p.get('position', 'N/A')}"
+                    for i, p in enumerate(people, 1)
+                )
 
-            if context.animals:
-                animal_strs = [f"{a.get('type')} ({a.get('description', '')})" for a in context.animals]
-                details.append(f"Animals: {', '.join(animal_strs)}")
+            if animals:
+                animal_strs = ", ".join(f"{a.get('type')} ({a.get('description', '')})" for a in animals)
+                details.append(f"Animals: {animal_strs}")
 
-            if context.objects:
-                details.append(f"Objects: {', '.join(context.objects)}")
+            if objects:
+                details.append(f"Objects: {', '.join(objects)}")
 
             details.append(f"Changes: {context.changes_detected}")
             details.append(f"Confidence: {context.confidence}")
-            details.append(f"Last updated: {context.timestamp:.1f}s ago" if context.timestamp else "Last updated: Unknown")
+            details.append(f"Last updated: {timestamp:.1f}s ago" if timestamp else "Last updated: Unknown")
 
             return "\n".join(details)
 
         except Exception as e:
-            logging.error(f"Error in get_scene_details: {e}")
+            logger.error("Error in get_scene_details: %s", e)
             return f"Error getting scene details: {str(e)}"
\ No newline at end of file
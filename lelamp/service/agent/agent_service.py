@@ -249,16 +249,10 @@ class LLM:
                     
                     # Trigger emotion analysis and reaction
                     try:
-                        from lelamp.service.emotion import get_emotion_service
-                        emotion_service = get_emotion_service()
+                        emotion_service = g.emotion_service
                         if emotion_service:
-                            # Run in background thread to not block main flow
-                            import threading
-                            threading.Thread(
-                                target=emotion_service.trigger_reaction,
-                                args=(transcript,),
-                                daemon=True
-                            ).start()
+                            # Runs on the emotion service's own loop, doesn't block main flow
+                            emotion_service.schedule_reaction(transcript)
                     except Exception as e:
                         logger.debug(f"Emotion analysis failed: {e}")
 
@@ -0,0 +1,10 @@
+"""
+Camera Service for LeLamp
+
+Provides a shared, long-lived camera grabber so tools can read the most
+recent frame without opening the device on every call.
+"""
+
+from .camera_service import CameraService, get_camera_service, init_camera_service
+
+__all__ = ['CameraService', 'get_camera_service', 'init_camera_service']
@@ -0,0 +1,182 @@
+"""
+Camera Service for LeLamp
+
+Keeps the camera open in a background grabber thread that always holds the
+latest frame, so concurrent callers share one device and one warmup. The device
+is reference counted and closed again when the last user releases it (or after
+idle_timeout seconds, if set), so other code can open it in between.
+"""
+
+import logging
+import threading
+import time
+from typing import Optional, Union
+
+import cv2
+import numpy as np
+
+
+# Global instance
+_camera_service: Optional['CameraService'] = None
+_camera_service_lock = threading.Lock()
+
+
+def get_camera_service() -> Optional['CameraService']:
+    """Get the global CameraService instance"""
+    return _camera_service
+
+
+def init_camera_service(camera_index: Union[int, str] = 0, idle_timeout: float = 0.0) -> 'CameraService':
+    """Initialize the global CameraService instance, or return it if it already exists"""
+    global _camera_service
+    # Concurrent callers must not each build a service and open the device twice
+    with _camera_service_lock:
+        if _camera_service is None:
+            _camera_service = CameraService(camera_index=camera_index, idle_timeout=idle_timeout)
+        return _camera_service
+
+
+class CameraService:
+    """
+    Shared camera grabber with a single-slot latest-frame buffer.
+
+    Usage:
+        camera = init_camera_service()
+        try:
+            camera.acquire()
+            frame = camera.latest_frame()
+        finally:
+            camera.release()
+    """
+
+    # Frames to let the camera settle (auto-exposure / white balance) after opening
+    WARMUP_FRAMES = 5
+
+    def __init__(self, camera_index: Union[int, str] = 0, idle_timeout: float = 0.0):
+        """
+        Initialize camera service.
+
+        Args:
+            camera_index: OpenCV camera index or device path
+            idle_timeout: Seconds to keep the device open after the last release (0 closes it right away)
+        """
+        self.camera_index = camera_index
+        self.idle_timeout = idle_timeout
+        self.logger = logging.getLogger(__name__)
+
+        self._cap: Optional[cv2.VideoCapture] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+        # Latest frame (1-slot buffer)
+        self._frame: Optional[np.ndarray] = None
+        self._frame_lock = threading.Lock()
+        self._frame_ready = threading.Event()
+
+        # Reference counting
+        self._refcount = 0
+        self._ref_lock = threading.Lock()
+        self._idle_timer: Optional[threading.Timer] = None
+
+    def acquire(self):
+        """Register a user of the camera, starting the grabber thread if needed."""
+        with self._ref_lock:
+            self._refcount += 1
+            if self._idle_timer:
+                self._idle_timer.cancel()
+                self._idle_timer = None
+            if not self._running:
+                self._start()
+
+    def release(self):
+        """Unregister a user; the last release closes the device, after idle_timeout seconds if set (may block)."""
+        with self._ref_lock:
+            self._refcount = max(0, self._refcount - 1)
+            if self._refcount == 0 and self._running and self.idle_timeout <= 0:
+                self._stop()
+            elif self._refcount == 0 and self._running and self._idle_timer is None:
+                self._idle_timer = threading.Timer(self.idle_timeout, self._stop_if_idle)
+                self._idle_timer.daemon = True
+                self._idle_timer.start()
+
+    def latest_frame(self, timeout: float = 3.0) -> Optional[np.ndarray]:
+        """
+        Get the most recent frame.
+
+        Args:
+            timeout: Seconds to wait for the first frame after the camera was opened
+
+        Returns:
+            BGR frame, or None if the camera could not provide one
+        """
+        if not self._frame_ready.wait(timeout):
+            return None
+        with self._frame_lock:
+            return self._frame
+
+    def stop(self):
+        """Stop the grabber thread and close the device."""
+        with self._ref_lock:
+            if self._idle_timer:
+                self._idle_timer.cancel()
+                self._idle_timer = None
+            self._stop()
+
+    def _start(self):
+        self._running = True
+        self._frame_ready.clear()
+        self._thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self._thread.start()
+        self.logger.info(f"Camera service started (camera: {self.camera_index})")
+
+    def _stop(self):
+        self._running = False
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2.0)
+        self._thread = None
+        with self._frame_lock:
+            self._frame = None
+        self._frame_ready.clear()
+        self.logger.info("Camera service stopped")
+
+    def _stop_if_idle(self):
+        with self._ref_lock:
+            self._idle_timer = None
+            if self._refcount == 0 and self._running:
+                self._stop()
+
+    def _open_camera(self) -> Optional[cv2.VideoCapture]:
+        """Open the camera and let it settle"""
+        cap = cv2.VideoCapture(self.camera_index)
+        if not cap.isOpened():
+            cap.release()
+            return None
+
+        # grab() advances the device without decoding; warmup frames are thrown away
+        for _ in range(self.WARMUP_FRAMES):
+            if not cap.grab():
+                break
+        return cap
+
+    def _capture_loop(self):
+        """Grab frames continuously, keeping only the latest one"""
+        self._cap = self._open_camera()
+        if self._cap is None:
+            self.logger.error(f"Could not open camera {self.camera_index}")
+            self._running = False
+            # Wake up waiters so they don't block for the full timeout
+            self._frame_ready.set()
+            return
+
+        try:
+            while self._running:
+                ret, frame = self._cap.read()
+                if not ret:
+                    time.sleep(0.05)
+                    continue
+                with self._frame_lock:
+                    self._frame = frame
+                self._frame_ready.set()
+        finally:
+            self._cap.release()
+            self._cap = None
@@ -3,8 +3,16 @@ Emotion Service for LeLamp
 
 Provides emotion detection from text using Google Gemini API,
 with automatic animation triggering based on detected emotions.
-"""
 
-from .emotion_service import EmotionService, get_emotion_service, init_emotion_service
+The service module (and the Gemini SDK it pulls in) is only imported on
+first attribute access, so importing this package stays cheap.
+"""
 
 __all__ = ['EmotionService', 'get_emotion_service', 'init_emotion_service']
+
+
+def __getattr__(name):
+    if name in __all__:
+        from . import emotion_service
+        return getattr(emotion_service, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,18 +6,26 @@ matching animations based on detected emotions.
 """
 
 import os
+import json
+import re
+import asyncio
 import logging
 import time
+import tempfile
 import threading
-from typing import Optional, Dict
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future
+from typing import AsyncIterator, Optional, Dict, List, Tuple
 from enum import Enum
+from functools import lru_cache
 
 try:
-    import google.generativeai as genai
+    from google import genai
+    from google.genai import types
     GEMINI_AVAILABLE = True
 except ImportError:
     GEMINI_AVAILABLE = False
-    logging.warning("google-generativeai not available. Emotion service will be disabled.")
+    logging.warning("google-genai not available. Emotion service will be disabled.")
 
 import lelamp.globals as g
 from lelamp.user_data import get_recording_path
@@ -37,6 +45,91 @@ class Emotion(Enum):
     NEUTRAL = "neutral"
 
 
+# Local fast path: unambiguous phrasings that don't need a Gemini round trip. Emotion words
+# only count when the speaker claims them ("i'm sad", not "a movie about a sad clown");
+# phrases that are often neutral in speech ("happy to help", "let's go", "love it") stay with Gemini
+_FIRST_PERSON = r"\b(?:i[’']?m|i am|i feel|i[’']?m feeling)(?: (?:so|really|very|super|pretty))? "
+_KEYWORD_PATTERNS = {
+    Emotion.HAPPY: re.compile(r"\byay\b|" + _FIRST_PERSON + r"happy\b(?! to\b)"),
+    Emotion.EXCITED: re.compile(r"\b(?:woohoo|so pumped|so excited)\b|" + _FIRST_PERSON + r"excited\b"),
+    Emotion.SAD: re.compile(_FIRST_PERSON + r"(?:sad|depressed|heartbroken)\b"),
+    Emotion.ANGRY: re.compile(_FIRST_PERSON + r"(?:angry|furious|annoyed|frustrated|pissed)\b"),
+    Emotion.SURPRISED: re.compile(r"\bomg\b|" + _FIRST_PERSON + r"(?:surprised|shocked)\b"),
+    Emotion.CURIOUS: re.compile(_FIRST_PERSON + r"curious\b"),
+}
+# Negations flip or muddy keyword meaning ("not happy"), so leave those to Gemini
+_NEGATION_RE = re.compile(r"\b(not|never|no)\b|n't\b")
+# Longer texts are more likely to mix emotions
+_KEYWORD_MAX_WORDS = 12
+_KEYWORD_CONFIDENCE = 0.9
+
+
+# Raw emotion labels (and common synonyms) to Emotion
+_EMOTION_MAP = {
+    "happy": Emotion.HAPPY,
+    "excited": Emotion.EXCITED,
+    "joy": Emotion.EXCITED,
+    "sad": Emotion.SAD,
+    "disappointed": Emotion.SAD,
+    "upset": Emotion.SAD,
+    "curious": Emotion.CURIOUS,
+    "interested": Emotion.CURIOUS,
+    "wondering": Emotion.CURIOUS,
+    "thoughtful": Emotion.THOUGHTFUL,
+    "thinking": Emotion.THOUGHTFUL,
+    "contemplating": Emotion.THOUGHTFUL,
+    "angry": Emotion.ANGRY,
+    "frustrated": Emotion.ANGRY,
+    "annoyed": Emotion.ANGRY,
+    "surprised": Emotion.SURPRISED,
+    "shocked": Emotion.SURPRISED,
+    "neutral": Emotion.NEUTRAL,
+    "calm": Emotion.NEUTRAL
+}
+
+# Gemini structured output schema: one object per analyzed text, labels constrained to the Emotion values.
+# Types use the upper-case REST enum names: the Batch Mode JSONL is sent as-is, without the SDK's conversion
+_RESPONSE_SCHEMA = {
+    "type": "ARRAY",
+    "items": {
+        "type": "OBJECT",
+        "properties": {
+            "index": {"type": "INTEGER"},
+            "emotion": {"type": "STRING", "enum": [e.value for e in Emotion]},
+            "confidence": {"type": "NUMBER"},
+            "reasoning": {"type": "STRING"},
+        },
+        "required": ["index", "emotion", "confidence"],
+    },
+}
+
+
+# Sent once per request as the system instruction; the per-call contents are only the texts
+_SYSTEM_INSTRUCTION = (
+    "You are an emotion classifier. The user sends numbered texts, one per line, each a JSON string. "
+    "For each text, return one object with its number as index, its emotion, a confidence from "
+    "0.0 to 1.0, and a brief reasoning."
+)
+
+
+# Terminal states of a Gemini batch job
+_BATCH_DONE_STATES = {"JOB_STATE_SUCCEEDED", "JOB_STATE_FAILED", "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED"}
+
+
+@lru_cache(maxsize=4)
+def _get_genai_client(api_key: str) -> 'genai.Client':
+    """Get a process-wide Gemini client per API key, so re-inits share its connection pools"""
+    return genai.Client(api_key=api_key)
+
+
+@lru_cache(maxsize=1)
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """Get the process-wide emotion event loop; the shared client's async pool is bound to it"""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True, name="emotion-loop").start()
+    return loop
+
+
 # Global instance
 _emotion_service: Optional['EmotionService'] = None
 
@@ -49,6 +142,11 @@ def get_emotion_service() -> Optional['EmotionService']:
 def init_emotion_service(config: dict) -> Optional['EmotionService']:
     """Initialize the global EmotionService instance"""
     global _emotion_service
+
+    # Re-init replaces the service; stop the old one's batch worker on the shared loop
+    if _emotion_service is not None:
+        _emotion_service.stop()
+        _emotion_service = None
     
     emotion_config = config.get("emotion", {})
     if not emotion_config.get("enabled", False):
@@ -61,7 +159,10 @@ def init_emotion_service(config: dict) -> Optional['EmotionService']:
             model=emotion_config.get("model", "gemini-1.5-flash"),
             auto_react=emotion_config.get("auto_react", True),
             min_confidence=emotion_config.get("min_confidence", 0.7),
-            cooldown_seconds=emotion_config.get("cooldown_seconds", 2.0)
+            cooldown_seconds=emotion_config.get("cooldown_seconds", 2.0),
+            max_concurrent=emotion_config.get("max_concurrent", 2),
+            batch_window_ms=emotion_config.get("batch_window_ms", 150),
+            max_batch=emotion_config.get("max_batch", 8)
         )
         logger.info("Emotion service initialized")
         return _emotion_service
@@ -78,6 +179,9 @@ class EmotionService:
     Uses Google Gemini API to analyze transcribed user text for emotions,
     then automatically triggers matching recordings based on detected emotions.
     """
+
+    # Maximum number of cached analysis results
+    CACHE_SIZE = 512
     
     def __init__(
         self,
@@ -85,7 +189,10 @@ class EmotionService:
         model: str = "gemini-1.5-flash",
         auto_react: bool = True,
         min_confidence: float = 0.7,
-        cooldown_seconds: float = 2.0
+        cooldown_seconds: float = 2.0,
+        max_concurrent: int = 2,
+        batch_window_ms: float = 150,
+        max_batch: int = 8
     ):
         """
         Initialize emotion service.
@@ -95,28 +202,55 @@ class EmotionService:
             model: Gemini model name (e.g., "gemini-1.5-flash")
             auto_react: If True, automatically trigger animations on emotion detection
             min_confidence: Minimum confidence (0-1) to trigger reaction
-            cooldown_seconds: Minimum seconds between reactions to prevent spam
+            cooldown_seconds: Minimum seconds between reactions to the same emotion to prevent spam
+            max_concurrent: Maximum Gemini requests in flight at once (rate limit guard)
+            batch_window_ms: How long to wait for more texts to classify in the same request
+            max_batch: Maximum number of texts classified per Gemini request
         """
         self.provider = provider
         self.model_name = model
         self.auto_react = auto_react
         self.min_confidence = min_confidence
         self.cooldown_seconds = cooldown_seconds
+        self.batch_window = batch_window_ms / 1000.0
+        self.max_batch = max(1, max_batch)
         
         self.logger = logging.getLogger(__name__)
-        self._last_reaction_time = 0.0
-        self._cooldown_lock = threading.Lock()
+        # Last reaction time per emotion, so e.g. surprised -> happy isn't throttled like
+        # surprised -> surprised. Only touched from coroutines on the service loop
+        # (see schedule_reaction), so no lock
+        self._last_reaction_time: Dict[Emotion, float] = defaultdict(lambda: float("-inf"))
+
+        # LRU of normalized text -> analysis result; transcripts repeat a lot ("yes", "okay", "thank you")
+        self._cache: "OrderedDict[str, Dict[str, any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
         
         # Initialize Gemini client
         if not GEMINI_AVAILABLE:
-            raise RuntimeError("google-generativeai package not installed")
+            raise RuntimeError("google-genai package not installed")
         
         api_key = os.getenv("GOOGLE_API_KEY")
         if not api_key:
             raise ValueError("GOOGLE_API_KEY environment variable not set")
         
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel(model)
+        self._client = _get_genai_client(api_key)
+        self._generation_config = types.GenerateContentConfig(
+            system_instruction=_SYSTEM_INSTRUCTION,
+            temperature=0.3,
+            max_output_tokens=150 * self.max_batch,
+            response_mime_type="application/json",
+            response_schema=_RESPONSE_SCHEMA
+        )
+        self._request_semaphore = asyncio.Semaphore(max(1, max_concurrent))
+
+        # Dedicated event loop for the async Gemini client, so sync and async
+        # callers alike can schedule reactions without blocking on the round trip
+        self._loop = _get_event_loop()
+
+        # Micro-batching of analyze_emotion requests
+        self._batch_queue: asyncio.Queue = asyncio.Queue()
+        self._batch_tasks = set()
+        self._batch_worker_future = asyncio.run_coroutine_threadsafe(self._batch_worker(), self._loop)
         
         # Emotion to recording mapping
         self._emotion_to_recording = {
@@ -129,12 +263,18 @@ class EmotionService:
             Emotion.SURPRISED: ["luxo_excited", "excited"],
             Emotion.NEUTRAL: ["idle"]
         }
+        self._resolved_recordings: Dict[Emotion, Optional[str]] = {}
+        self.refresh_recording_map()
         
         self.logger.info(f"EmotionService initialized with model {model}")
     
-    def analyze_emotion(self, text: str) -> Optional[Dict[str, any]]:
+    async def analyze_emotion(self, text: str) -> Optional[Dict[str, any]]:
         """
         Analyze text for emotion using Gemini API.
+
+        Short texts with unambiguous emotion keywords are classified locally.
+        Other requests arriving within batch_window_ms of each other are
+        coalesced into a single Gemini call (see _batch_worker).
         
         Args:
             text: Input text to analyze
@@ -145,117 +285,281 @@ class EmotionService:
         """
         if not text or not text.strip():
             return None
-        
+
+        cache_key = self._cache_key(text)
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+        if cached is not None:
+            self.logger.debug("Emotion cache hit: '%s' for '%s'", cached['emotion'].value, text[:50])
+            return cached
+
+        result = self._match_keywords(cache_key)
+        if result is None:
+            if self._batch_worker_future.done():
+                return None  # Service stopped
+            future = self._loop.create_future()
+            await self._batch_queue.put((text, future))
+            result = await future
+
+        if result:
+            with self._cache_lock:
+                self._cache[cache_key] = result
+                if len(self._cache) > self.CACHE_SIZE:
+                    self._cache.popitem(last=False)
+        return result
+
+    def _match_keywords(self, normalized: str) -> Optional[Dict[str, any]]:
+        """
+        Classify short, unambiguous texts locally.
+
+        Args:
+            normalized: Lowercased, whitespace-normalized text
+
+        Returns:
+            Result dict if exactly one emotion's keywords match, else None (ask Gemini)
+        """
+        if normalized.count(" ") >= _KEYWORD_MAX_WORDS or _NEGATION_RE.search(normalized):
+            return None
+        # Questions ("are you excited?") ask about an emotion rather than express one
+        if "?" in normalized:
+            return None
+
+        matches = [emotion for emotion, pattern in _KEYWORD_PATTERNS.items() if pattern.search(normalized)]
+        if len(matches) != 1:
+            return None
+
+        emotion = matches[0]
+        self.logger.debug("Emotion keyword match: '%s' for '%s'", emotion.value, normalized[:50])
+        return {
+            "emotion": emotion,
+            "emotion_str": emotion.value,
+            "confidence": _KEYWORD_CONFIDENCE,
+            "reasoning": "keyword match",
+            "raw_response": ""
+        }
+
+    def stop(self):
+        """Stop the batch worker; queued analyses resolve to no result. Safe to call from any thread."""
+        self._batch_worker_future.cancel()
+
+    async def _batch_worker(self):
+        """Drain queued analyze_emotion requests in micro-batches of up to max_batch texts"""
+        batch = []
         try:
-            prompt = f"""Analyze the following text for emotion. Respond with ONLY a JSON object in this exact format:
-{{
-    "emotion": "happy|excited|sad|curious|thoughtful|angry|surprised|neutral",
-    "confidence": 0.0-1.0,
-    "reasoning": "brief explanation"
-}}
+            while True:
+                batch = [await self._batch_queue.get()]
+                deadline = self._loop.time() + self.batch_window
+                while len(batch) < self.max_batch:
+                    remaining = deadline - self._loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._batch_queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
 
-Text to analyze: "{text}"
+                # Let the next window fill while this request is in flight
+                task = self._loop.create_task(self._run_batch(batch))
+                self._batch_tasks.add(task)
+                task.add_done_callback(self._batch_tasks.discard)
+                batch = []
+        finally:
+            # Stopped: don't leave callers waiting on requests that will never be sent
+            while not self._batch_queue.empty():
+                batch.append(self._batch_queue.get_nowait())
+            for _, future in batch:
+                if not future.done():
+                    future.set_result(None)
 
-JSON response:"""
-            
-            response = self.model.generate_content(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.3,
-                    max_output_tokens=150
-                )
+    async def _run_batch(self, batch: List[Tuple[str, asyncio.Future]]):
+        """Classify a batch, resolving each request's future as soon as its result streams in"""
+        try:
+            async for index, result in self._classify([text for text, _ in batch]):
+                future = batch[index][1]
+                if not future.done():
+                    future.set_result(result)
+        except Exception as e:
+            self.logger.error(f"Error analyzing emotion: {e}")
+
+        # Anything the response didn't cover resolves to no result
+        for _, future in batch:
+            if not future.done():
+                future.set_result(None)
+
+    async def _classify(self, texts: List[str]) -> AsyncIterator[Tuple[int, Dict[str, any]]]:
+        """
+        Classify several texts with one streamed Gemini request.
+
+        The response is a JSON array; each element is parsed as soon as it is complete,
+        so early texts in a batch don't wait for the tail of the response.
+
+        Args:
+            texts: Texts to analyze
+
+        Yields:
+            (index into texts, result dict) for each element of the response
+        """
+        prompt = self._build_prompt(texts)
+        decoder = json.JSONDecoder()
+        buffer = ""
+        pos = 0
+        seen = set()
+
+        async with self._request_semaphore:
+            stream = await self._client.aio.models.generate_content_stream(
+                model=self.model_name,
+                contents=prompt,
+                config=self._generation_config
             )
-            
-            # Parse response - try to extract JSON
-            response_text = response.text.strip()
-            
-            # Find JSON in response (might have markdown code blocks)
-            import json
-            import re
-            
-            result = None
-            
-            # Try to extract JSON from markdown code block
-            json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', response_text, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
-                try:
-                    result = json.loads(json_str)
-                except json.JSONDecodeError:
-                    pass
-            
-            if not result:
-                # Try to find JSON object directly
-                json_match = re.search(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', response_text, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(0)
+            async for chunk in stream:
+                buffer += chunk.text or ""
+
+                # Structured output mode guarantees a JSON array matching _RESPONSE_SCHEMA;
+                # pull out every element that is complete so far
+                while True:
+                    while pos < len(buffer) and buffer[pos] in " \t\r\n[,":
+                        pos += 1
+                    if pos >= len(buffer) or buffer[pos] == "]":
+                        break
                     try:
-                        result = json.loads(json_str)
+                        item, end = decoder.raw_decode(buffer, pos)
                     except json.JSONDecodeError:
-                        pass
-            
-            if not result:
-                # Last resort: try parsing entire response
-                try:
-                    result = json.loads(response_text)
-                except json.JSONDecodeError:
-                    self.logger.warning(f"Failed to parse Gemini response as JSON: {response_text[:100]}")
-                    return None
-            
-            if not result:
-                return None
-            
-            # Validate result
-            emotion_str = result.get("emotion", "").lower()
-            confidence = float(result.get("confidence", 0.0))
-            reasoning = result.get("reasoning", "")
-            
-            # Map to Emotion enum
-            emotion_map = {
-                "happy": Emotion.HAPPY,
-                "excited": Emotion.EXCITED,
-                "joy": Emotion.EXCITED,
-                "sad": Emotion.SAD,
-                "disappointed": Emotion.SAD,
-                "upset": Emotion.SAD,
-                "curious": Emotion.CURIOUS,
-                "interested": Emotion.CURIOUS,
-                "wondering": Emotion.CURIOUS,
-                "thoughtful": Emotion.THOUGHTFUL,
-                "thinking": Emotion.THOUGHTFUL,
-                "contemplating": Emotion.THOUGHTFUL,
-                "angry": Emotion.ANGRY,
-                "frustrated": Emotion.ANGRY,
-                "annoyed": Emotion.ANGRY,
-                "surprised": Emotion.SURPRISED,
-                "shocked": Emotion.SURPRISED,
-                "neutral": Emotion.NEUTRAL,
-                "calm": Emotion.NEUTRAL
-            }
-            
-            emotion = emotion_map.get(emotion_str, Emotion.NEUTRAL)
-            
-            # Log detected emotion with details
-            log_msg = (
-                f"🎭 Emotion detected: '{emotion.value}' (raw: '{emotion_str}') "
-                f"with confidence {confidence:.2f} "
-                f"- Reasoning: {reasoning[:100] if reasoning else 'N/A'}"
+                        break  # Element still incomplete, wait for more text
+                    item_text = buffer[pos:end]
+                    pos = end
+
+                    # Match results to texts by the echoed number, never by array position
+                    index = item.get("index")
+                    if not isinstance(index, int) or not 1 <= index <= len(texts) or index in seen:
+                        self.logger.warning(f"Ignoring emotion result with unexpected index {index!r}")
+                        continue
+                    seen.add(index)
+                    yield index - 1, self._to_result(item, item_text)
+
+        if len(seen) != len(texts):
+            self.logger.warning(f"Gemini returned {len(seen)} results for {len(texts)} texts")
+
+    @staticmethod
+    def _build_prompt(texts: List[str]) -> str:
+        """Build the per-request contents: just the numbered texts (instructions live in _SYSTEM_INSTRUCTION)"""
+        # JSON-escape each text so quotes or newlines in a transcript can't shift the numbering
+        return "\n".join(f"{i}. {json.dumps(text, ensure_ascii=False)}" for i, text in enumerate(texts, 1))
+
+    def classify_batch_offline(self, texts: List[str], poll_interval: float = 30.0) -> List[Optional[Dict[str, any]]]:
+        """
+        Classify stored transcripts through Gemini Batch Mode.
+
+        For backfills and relabeling only: jobs are billed at half price but may take
+        up to 24 hours, and this call blocks until the job finishes. Does not touch the
+        real-time request queue or the reaction cooldown.
+
+        Args:
+            texts: Texts to analyze
+            poll_interval: Seconds between job status checks
+
+        Returns:
+            One result dict (or None if that request failed) per text, in order
+        """
+        if not texts:
+            return []
+
+        with tempfile.NamedTemporaryFile("w", suffix=".jsonl", delete=False) as f:
+            for i, text in enumerate(texts):
+                request = {
+                    "contents": [{"parts": [{"text": self._build_prompt([text])}]}],
+                    "system_instruction": {"parts": [{"text": _SYSTEM_INSTRUCTION}]},
+                    "generation_config": {
+                        "temperature": 0.3,
+                        "response_mime_type": "application/json",
+                        "response_schema": _RESPONSE_SCHEMA,
+                    },
+                }
+                f.write(json.dumps({"key": f"req_{i}", "request": request}) + "\n")
+            requests_path = f.name
+
+        try:
+            uploaded = self._client.files.upload(
+                file=requests_path,
+                config=types.UploadFileConfig(display_name="lelamp-emotion-batch", mime_type="jsonl")
             )
-            self.logger.info(log_msg)
-            print(log_msg)  # Also print to console for visibility
-            
-            return {
-                "emotion": emotion,
-                "emotion_str": emotion.value,
-                "confidence": confidence,
-                "reasoning": reasoning,
-                "raw_response": response_text
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error analyzing emotion: {e}")
-            return None
+        finally:
+            os.unlink(requests_path)
+
+        job = self._client.batches.create(model=self.model_name, src=uploaded.name)
+        self.logger.info(f"Submitted emotion batch job {job.name} ({len(texts)} texts)")
+
+        while job.state.name not in _BATCH_DONE_STATES:
+            time.sleep(poll_interval)
+            job = self._client.batches.get(name=job.name)
+
+        if job.state.name != "JOB_STATE_SUCCEEDED":
+            raise RuntimeError(f"Emotion batch job {job.name} ended in state {job.state.name}")
+
+        keys = {f"req_{i}": i for i in range(len(texts))}
+        results: List[Optional[Dict[str, any]]] = [None] * len(texts)
+        output = self._client.files.download(file=job.dest.file_name).decode("utf-8")
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            index = keys.get(entry.get("key"))
+            if index is None:
+                continue
+            try:
+                parts = entry["response"]["candidates"][0]["content"]["parts"]
+                response_text = "".join(part.get("text", "") for part in parts)
+                items = json.loads(response_text)
+                if items:
+                    results[index] = self._to_result(items[0], response_text)
+            except (KeyError, IndexError, ValueError) as e:
+                self.logger.warning(f"Batch request {entry.get('key')} failed: {entry.get('error', e)}")
+
+        return results
+
+    def _to_result(self, item: Dict[str, any], response_text: str) -> Dict[str, any]:
+        """Convert one parsed response object into an analysis result"""
+        emotion_str = item.get("emotion", "").lower()
+        confidence = float(item.get("confidence", 0.0))
+        reasoning = item.get("reasoning", "")
+
+        emotion = _EMOTION_MAP.get(emotion_str, Emotion.NEUTRAL)
+
+        # Log detected emotion with details
+        self.logger.info(
+            "🎭 Emotion detected: '%s' (raw: '%s') with confidence %.2f - Reasoning: %s",
+            emotion.value, emotion_str, confidence, reasoning[:100] if reasoning else 'N/A'
+        )
+
+        return {
+            "emotion": emotion,
+            "emotion_str": emotion.value,
+            "confidence": confidence,
+            "reasoning": reasoning,
+            "raw_response": response_text
+        }
     
+    @staticmethod
+    def _cache_key(text: str) -> str:
+        """Normalize text for the analysis cache (case and whitespace insensitive)"""
+        return " ".join(text.lower().split())[:256]
+
+    def refresh_recording_map(self):
+        """
+        Resolve each emotion to the first of its candidate recordings that exists.
+
+        Called once at init; call again after recordings are added or deleted.
+        """
+        resolved = {}
+        for emotion, recordings in self._emotion_to_recording.items():
+            # If none found, fall back to the first option anyway (will fail gracefully)
+            resolved[emotion] = next(
+                (name for name in recordings if get_recording_path(name) is not None),
+                recordings[0] if recordings else None
+            )
+        self._resolved_recordings = resolved
+
     def map_emotion_to_recording(self, emotion: Emotion) -> Optional[str]:
         """
         Map detected emotion to a recording name.
@@ -266,20 +570,27 @@ JSON response:"""
         Returns:
             Recording name, or None if no mapping found
         """
-        recordings = self._emotion_to_recording.get(emotion, [])
-        
-        if not recordings:
-            return None
-        
-        # Try each recording in order until we find one that exists
-        for recording_name in recordings:
-            if get_recording_path(recording_name) is not None:
-                return recording_name
-        
-        # If none found, return first option anyway (will fail gracefully)
-        return recordings[0] if recordings else None
+        return self._resolved_recordings.get(emotion)
     
-    def trigger_reaction(self, text: str) -> bool:
+    def schedule_reaction(self, text: str) -> Future:
+        """
+        Run trigger_reaction in the background on the service's event loop.
+
+        Safe to call from any thread or coroutine; returns immediately.
+
+        Args:
+            text: User transcription text
+
+        Returns:
+            concurrent.futures.Future resolving to trigger_reaction's result
+        """
+        return asyncio.run_coroutine_threadsafe(self.trigger_reaction(text), self._loop)
+
+    def _in_cooldown(self, emotion: Emotion) -> bool:
+        """Check whether the last reaction to this emotion was less than cooldown_seconds ago"""
+        return time.monotonic() - self._last_reaction_time[emotion] < self.cooldown_seconds
+
+    async def trigger_reaction(self, text: str) -> bool:
         """
         Analyze text for emotion and trigger animation if emotion detected.
         
@@ -292,19 +603,11 @@ JSON response:"""
         if not self.auto_react:
             return False
         
-        # Check cooldown
-        with self._cooldown_lock:
-            current_time = time.time()
-            if current_time - self._last_reaction_time < self.cooldown_seconds:
-                return False
-        
         # Analyze emotion
-        self.logger.debug(f"Analyzing emotion for text: '{text[:100]}...'")
-        print(f"🔍 Analyzing emotion for: '{text[:80]}...'")
-        result = self.analyze_emotion(text)
+        self.logger.debug("🔍 Analyzing emotion for text: '%s...'", text[:100])
+        result = await self.analyze_emotion(text)
         if not result:
             self.logger.debug("Emotion analysis returned no result")
-            print("⚠️  Emotion analysis returned no result")
             return False
         
         emotion = result["emotion"]
@@ -312,31 +615,30 @@ JSON response:"""
         
         # Check minimum confidence
         if confidence < self.min_confidence:
-            log_msg = (
-                f"⚠️  Emotion '{emotion.value}' detected with confidence {confidence:.2f} "
-                f"below threshold {self.min_confidence} - skipping reaction"
+            self.logger.info(
+                "⚠️  Emotion '%s' detected with confidence %.2f below threshold %s - skipping reaction",
+                emotion.value, confidence, self.min_confidence
             )
-            self.logger.info(log_msg)
-            print(log_msg)
             return False
         
         # Skip neutral emotions
         if emotion == Emotion.NEUTRAL:
-            self.logger.debug(f"Neutral emotion detected - skipping reaction")
-            print(f"ℹ️  Neutral emotion detected - skipping reaction")
+            self.logger.debug("Neutral emotion detected - skipping reaction")
+            return False
+        
+        # Check cooldown for this emotion. Everything from here to the update below runs
+        # without an await, so concurrent analyses can't both pass it
+        if self._in_cooldown(emotion):
+            self.logger.debug("Emotion '%s' is cooling down - skipping reaction", emotion.value)
             return False
         
         # Map to recording
         recording_name = self.map_emotion_to_recording(emotion)
         if not recording_name:
-            log_msg = f"⚠️  No recording mapping found for emotion: {emotion.value}"
-            self.logger.warning(log_msg)
-            print(log_msg)
+            self.logger.warning("⚠️  No recording mapping found for emotion: %s", emotion.value)
             return False
         
-        log_msg = f"📋 Mapped emotion '{emotion.value}' → recording: '{recording_name}'"
-        self.logger.info(log_msg)
-        print(log_msg)
+        self.logger.info("📋 Mapped emotion '%s' → recording: '%s'", emotion.value, recording_name)
         
         # Check if animation service is available
         if not g.animation_service:
@@ -345,22 +647,19 @@ JSON response:"""
         
         # Check if recording exists
         if get_recording_path(recording_name) is None:
-            self.logger.warning(f"Recording '{recording_name}' not found")
+            self.logger.warning("Recording '%s' not found", recording_name)
             return False
         
         # Trigger animation (non-blocking)
         try:
             g.animation_service.dispatch("play", recording_name)
-            log_msg = (
-                f"✅ Emotion reaction triggered: '{emotion.value}' → '{recording_name}' "
-                f"(confidence: {confidence:.2f}, text: '{text[:50]}...')"
+            self.logger.info(
+                "✅ Emotion reaction triggered: '%s' → '%s' (confidence: %.2f, text: '%s...')",
+                emotion.value, recording_name, confidence, text[:50]
             )
-            self.logger.info(log_msg)
-            print(log_msg)  # Always print to console for visibility
             
             # Update cooldown
-            with self._cooldown_lock:
-                self._last_reaction_time = current_time
+            self._last_reaction_time[emotion] = time.monotonic()
             
             return True
         except Exception as e:
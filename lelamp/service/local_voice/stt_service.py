@@ -9,6 +9,8 @@ import time
 import logging
 from typing import Optional, Tuple, List
 
+import lelamp.globals as g
+
 logger = logging.getLogger(__name__)
 
 # Lazy import for faster startup
@@ -219,16 +221,10 @@ class LocalSTTService:
                         
                         # Trigger emotion analysis and reaction
                         try:
-                            from lelamp.service.emotion import get_emotion_service
-                            emotion_service = get_emotion_service()
+                            emotion_service = g.emotion_service
                             if emotion_service:
-                                # Run in background thread to not block main flow
-                                import threading
-                                threading.Thread(
-                                    target=emotion_service.trigger_reaction,
-                                    args=(text,),
-                                    daemon=True
-                                ).start()
+                                # Runs on the emotion service's own loop, doesn't block main flow
+                                emotion_service.schedule_reaction(text)
                         except Exception as e:
                             logger.debug(f"Emotion analysis failed: {e}")
                         
@@ -3,7 +3,9 @@ import csv
 import time
 import random
 import threading
-from typing import Any, List, Dict, Optional, Tuple, Callable
+from functools import lru_cache
+from typing import Any, List, Dict, Optional, Sequence, Tuple, Union, Callable
+import numpy as np
 from lelamp.follower import LeLampFollowerConfig, LeLampFollower
 from lelamp.service.motors.modifiers import (
     ModifierStack,
@@ -23,7 +25,46 @@ from lelamp.user_data import (
 LAMP_ID = "lelamp"
 
 
+@lru_cache(maxsize=32)
+def _build_trajectory(tracks: Tuple[Tuple[str, Tuple[float, ...], Tuple[float, ...]], ...], fps: int) -> Tuple[Tuple[str, ...], np.ndarray]:
+    """
+    Build a smooth joint-space trajectory from per-joint keyframe tracks using PCHIP interpolation.
+
+    PCHIP is shape-preserving, so the motion never overshoots a keyframe. The result is
+    cached so an animation's spline is only built once per process.
+
+    Args:
+        tracks: Hashable tracks as ((joint, times, positions), ...), times sorted ascending
+        fps: Sample rate of the returned trajectory
+
+    Returns:
+        (joints, trajectory) where trajectory has one row per frame and one column per joint
+    """
+    # scipy.interpolate is slow to import; only pay for it once keyframes are actually submitted
+    from scipy.interpolate import PchipInterpolator
+
+    joints = tuple(joint for joint, _, _ in tracks)
+    end_time = max(times[-1] for _, times, _ in tracks)
+    times = np.arange(int(round(end_time * fps)) + 1, dtype=np.float64) / fps
+    trajectory = np.empty((len(times), len(joints)), dtype=np.float32)
+
+    for col, (_, kf_times, kf_positions) in enumerate(tracks):
+        if len(kf_times) < 2:
+            trajectory[:, col] = kf_positions[0]
+            continue
+
+        kf_times = np.asarray(kf_times, dtype=np.float64)
+        # Hold the first/last keyframe outside the joint's own time span
+        clipped = np.clip(times, kf_times[0], kf_times[-1])
+        trajectory[:, col] = PchipInterpolator(kf_times, np.asarray(kf_positions, dtype=np.float64))(clipped)
+
+    return joints, trajectory
+
+
 class AnimationService:
+    # Seconds to reuse the recording directory scan in get_available_recordings
+    RECORDINGS_LIST_TTL = 30.0
+
     def __init__(self, port: str, fps: int = 30, duration: float = 5.0, idle_recording: str = "idle", config: Dict = None):
         self.port = port
         self.fps = fps
@@ -35,6 +76,7 @@ class AnimationService:
 
         # State management
         self._recording_cache: Dict[str, List[Dict[str, float]]] = {}
+        self._recordings_list: Optional[Tuple[float, Tuple[str, ...]]] = None  # (scanned_at, names)
         self._current_state: Optional[Dict[str, float]] = None
         self._current_recording: Optional[str] = None
         self._current_frame_index: int = 0
@@ -441,6 +483,9 @@ class AnimationService:
     
     def _event_loop(self):
         """Custom event loop that supports interruption"""
+        # Frames are scheduled against absolute deadlines so per-frame jitter does not accumulate
+        frame_period = 1.0 / self.fps
+        next_frame = time.perf_counter()
         while self._running.is_set():
             # Check for events
             with self._event_lock:
@@ -457,15 +502,130 @@ class AnimationService:
             
             # Continue current playback
             self._continue_playback()
-            
-            time.sleep(1.0 / self.fps)  # Frame rate timing
+
+            # Frame rate timing
+            next_frame += frame_period
+            sleep_time = next_frame - time.perf_counter()
+            if sleep_time > 0:
+                time.sleep(sleep_time)
+            else:
+                # Fell behind (e.g. slow bus access) - resync instead of bursting frames
+                next_frame = time.perf_counter()
     
     def handle_event(self, event_type: str, payload: Any):
         if event_type == "play":
             self._handle_play(payload)
+        elif event_type == "keyframes":
+            name, actions = payload
+            self._handle_keyframes(name, actions)
         else:
             print(f"Unknown event type: {event_type}")
-    
+
+    def move_to_many(self, targets: Dict[str, float]) -> bool:
+        """
+        Move several joints at once with a single Goal_Position sync-write.
+
+        Args:
+            targets: Dict of joint name (e.g. 'base_yaw' or 'base_yaw.pos') to goal position
+
+        Returns:
+            True if the goal positions were sent, False if the robot is not connected
+        """
+        if not self.robot:
+            return False
+
+        action = self._to_action(targets)
+        with self._bus_lock:
+            self.robot.send_action(action)
+        return True
+
+    def submit_keyframes(self, keyframes: Union[List[Tuple[float, Dict[str, float]]], Dict[str, Tuple[Sequence[float], Sequence[float]]]], name: str = "keyframes"):
+        """
+        Enqueue a whole keyframe animation to be timed by the service's frame loop.
+
+        Keyframes are turned into a smooth PCHIP trajectory sampled at the service fps,
+        and all joints of a frame go out in one sync-write. Callers no longer need an
+        asyncio.sleep chain.
+
+        Args:
+            keyframes: Either a list of (time_seconds, {joint: position}) tuples, or per-joint
+                tracks as {joint: (times, positions)} with parallel arrays (e.g. float32
+                numpy arrays). Times are relative to start.
+            name: Name used for logging and as the current recording name
+        """
+        actions = self._expand_keyframes(keyframes)
+        if not actions:
+            return
+        self.dispatch("keyframes", (name, actions))
+
+    @staticmethod
+    def _to_action(targets: Dict[str, float]) -> Dict[str, float]:
+        """Normalize joint names to the '<joint>.pos' action format."""
+        return {
+            joint if joint.endswith(".pos") else f"{joint}.pos": float(position)
+            for joint, position in targets.items()
+        }
+
+    @staticmethod
+    def _to_tracks(keyframes) -> Tuple[Tuple[str, Tuple[float, ...], Tuple[float, ...]], ...]:
+        """Convert keyframes into hashable per-joint (joint, times, positions) tracks sorted by joint."""
+        if isinstance(keyframes, dict):
+            tracks = {}
+            for joint, (times, positions) in keyframes.items():
+                times = np.asarray(times, dtype=np.float64)
+                positions = np.asarray(positions, dtype=np.float64)
+                if times.shape != positions.shape:
+                    raise ValueError(f"Keyframe track '{joint}' has {times.size} times but {positions.size} positions")
+                if times.size == 0:
+                    continue
+                order = np.argsort(times, kind="stable")
+                times, positions = times[order], positions[order]
+                # Match the list form: a later keyframe at the same time overrides an earlier one
+                last = np.append(times[1:] != times[:-1], True)
+                joint = joint if joint.endswith(".pos") else f"{joint}.pos"
+                tracks[joint] = (tuple(times[last].tolist()), tuple(positions[last].tolist()))
+        else:
+            # Transpose keyframe dicts into one column per joint; a later keyframe at the
+            # same time overrides an earlier one
+            points: Dict[str, Dict[float, float]] = {}
+            for t, positions in sorted(keyframes, key=lambda kf: kf[0]):
+                for joint, position in AnimationService._to_action(positions).items():
+                    points.setdefault(joint, {})[float(t)] = position
+            tracks = {joint: (tuple(p.keys()), tuple(p.values())) for joint, p in points.items()}
+
+        return tuple((joint, times, positions) for joint, (times, positions) in sorted(tracks.items()) if times)
+
+    def _expand_keyframes(self, keyframes) -> List[Dict[str, float]]:
+        """Sample keyframes at the service frame rate into smooth per-frame actions."""
+        if not keyframes:
+            return []
+
+        tracks = self._to_tracks(keyframes)
+        if not tracks:
+            return []
+        joints, trajectory = _build_trajectory(tracks, self.fps)
+        return [dict(zip(joints, row)) for row in trajectory.tolist()]
+
+    def _handle_keyframes(self, name: str, actions: List[Dict[str, float]]):
+        """Start playing pre-sampled keyframe actions"""
+        if not self.robot:
+            print("Robot not connected")
+            return
+
+        if self._sleep_mode:
+            print(f"🚫 ANIMATION SERVICE: Blocked keyframes '{name}' - in sleep mode (_sleep_mode=True)")
+            return
+
+        # Keyframes may name only some joints; hold the rest at the current pose so
+        # _current_state stays complete for the next interpolation
+        self._read_current_state()
+        if self._current_state is not None:
+            base = self._current_state
+            actions = [{**base, **action} for action in actions]
+
+        print(f"Starting keyframes {name} ({len(actions)} frames)")
+        self._start_actions(name, actions)
+
     def _handle_play(self, recording_name: str):
         """Start playing a recording with interpolation from current state"""
         if not self.robot:
@@ -483,7 +643,10 @@ class AnimationService:
             return
 
         print(f"Starting {recording_name} with interpolation")
+        self._start_actions(recording_name, actions)
 
+    def _start_actions(self, recording_name: str, actions: List[Dict[str, float]]):
+        """Set up playback of a list of actions with interpolation from current state"""
         # Set up new playback
         self._current_recording = recording_name
         self._current_actions = actions
@@ -491,14 +654,7 @@ class AnimationService:
 
         # If we don't have a current state, read it from motors first
         # This ensures smooth interpolation even after sleep/wake or service restart
-        if self._current_state is None and self.robot and self.robot.bus:
-            try:
-                current_pos = self.robot.bus.sync_read("Present_Position")
-                # Convert to action format (add .pos suffix)
-                self._current_state = {f"{k}.pos": v for k, v in current_pos.items()}
-                print(f"📍 ANIMATION SERVICE: Read current motor positions for interpolation: {self._current_state}")
-            except Exception as e:
-                print(f"⚠️ ANIMATION SERVICE: Could not read motor positions: {e}")
+        self._read_current_state()
 
         # Set up interpolation to the first frame
         if self._current_state is not None:
@@ -508,6 +664,17 @@ class AnimationService:
             self._interpolation_frames = 0
             self._interpolation_target = None
     
+    def _read_current_state(self):
+        """Read the current motor positions into _current_state if it is not set yet"""
+        if self._current_state is None and self.robot and self.robot.bus:
+            try:
+                current_pos = self.robot.bus.sync_read("Present_Position")
+                # Convert to action format (add .pos suffix)
+                self._current_state = {f"{k}.pos": v for k, v in current_pos.items()}
+                print(f"📍 ANIMATION SERVICE: Read current motor positions for interpolation: {self._current_state}")
+            except Exception as e:
+                print(f"⚠️ ANIMATION SERVICE: Could not read motor positions: {e}")
+
     def _continue_playback(self):
         """Continue current playback - called every frame"""
         # In manual control override (dashboard sliders), skip animation processing
@@ -551,7 +718,7 @@ class AnimationService:
         # Apply modifiers even when no animation is playing (for music bob, etc.)
         if not self._current_recording or not self._current_actions:
             # If any modifiers are enabled, apply them to current position
-            enabled_mods = {k: v for k, v in self._modifiers.list_modifiers().items() if v}
+            enabled_mods = self._modifiers.enabled_names()
             if enabled_mods:
                 if self._bus_lock.acquire(blocking=False):
                     try:
@@ -572,7 +739,7 @@ class AnimationService:
                         self._mod_debug_counter += 1
                         if self._mod_debug_counter % 30 == 0:
                             diff = modified_pitch - original_pitch
-                            print(f"\033[93m🎵 ANIM SVC: Applying modifiers {list(enabled_mods.keys())}, head_pitch diff={diff:.2f}°\033[0m")
+                            print(f"\033[93m🎵 ANIM SVC: Applying modifiers {enabled_mods}, head_pitch diff={diff:.2f}°\033[0m")
 
                         self.robot.send_action(modified_action)
                     except Exception as e:
@@ -602,7 +769,7 @@ class AnimationService:
                 # Apply modifiers (music bob, breathing, etc.)
                 modified_action = self._modifiers.apply(interpolated_action)
                 self.robot.send_action(modified_action)
-                self._current_state = interpolated_action.copy()  # Store unmodified for smooth transitions
+                self._current_state = interpolated_action  # Store unmodified for smooth transitions (apply() copies)
                 self._interpolation_frames -= 1
                 return
 
@@ -618,14 +785,15 @@ class AnimationService:
                 if not hasattr(self, '_anim_debug_counter'):
                     self._anim_debug_counter = 0
                 self._anim_debug_counter += 1
-                enabled_mods = {k: v for k, v in self._modifiers.list_modifiers().items() if v}
-                if self._anim_debug_counter % 30 == 0 and enabled_mods:
-                    diff = modified_pitch - original_pitch
-                    print(f"\033[96m🎵 ANIM PLAYBACK: recording={self._current_recording}, frame={self._current_frame_index}, "
-                          f"mods={list(enabled_mods.keys())}, wrist_pitch_diff={diff:.2f}°\033[0m")
+                if self._anim_debug_counter % 30 == 0:
+                    enabled_mods = self._modifiers.enabled_names()
+                    if enabled_mods:
+                        diff = modified_pitch - original_pitch
+                        print(f"\033[96m🎵 ANIM PLAYBACK: recording={self._current_recording}, frame={self._current_frame_index}, "
+                              f"mods={enabled_mods}, wrist_pitch_diff={diff:.2f}°\033[0m")
 
                 self.robot.send_action(modified_action)
-                self._current_state = action.copy()  # Store unmodified for smooth transitions
+                self._current_state = action  # Store unmodified for smooth transitions (frames are never mutated)
                 self._current_frame_index += 1
             else:
                 # Recording finished
@@ -674,9 +842,21 @@ class AnimationService:
     
     def get_available_recordings(self) -> List[str]:
         """Get list of recording names available (from both user and builtin directories)"""
+        # Recordings rarely change at runtime, so reuse the last scan for a while
+        now = time.monotonic()
+        cached = self._recordings_list
+        if cached is not None and now - cached[0] < self.RECORDINGS_LIST_TTL:
+            return list(cached[1])
+
         # Use user_data helper to get all recordings from both locations
         all_recordings = list_all_recordings()
-        return sorted([r['name'] for r in all_recordings])
+        names = tuple(sorted(r['name'] for r in all_recordings))
+        self._recordings_list = (now, names)
+        return list(names)
+
+    def invalidate_recordings_cache(self):
+        """Forget the cached recording list, e.g. after a recording was saved or deleted"""
+        self._recordings_list = None
     
     def apply_preset(self, preset_name: str = None) -> bool:
         """Apply a motor preset at runtime."""
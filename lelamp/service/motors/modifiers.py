@@ -13,9 +13,10 @@ Modifiers are composable and stack additively on target joints.
 import math
 import time
 import random
+import threading
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import Dict, Optional, Set, Callable
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional, Set, Callable
 
 
 class Modifier(ABC):
@@ -75,13 +76,21 @@ class Modifier(ABC):
             return action
 
         modified = action.copy()
-        for joint in self.target_joints:
-            if joint in modified:
-                offset = self.get_offset(joint, current_time)
-                modified[joint] += offset
-
+        self.apply_inplace(modified, current_time)
         return modified
 
+    def apply_inplace(self, action: Dict[str, float], current_time: float):
+        """
+        Add modifier offsets directly into an action dict.
+
+        Args:
+            action: Dict of joint positions, updated in place
+            current_time: Current time in seconds
+        """
+        for joint in self.target_joints:
+            if joint in action:
+                action[joint] += self.get_offset(joint, current_time)
+
 
 @dataclass
 class MusicConfig:
@@ -113,6 +122,7 @@ class MusicModifier(Modifier):
         energy_callback: Callable[[], float] = None,
     ):
         self.config = config or MusicConfig()
+        self._config_lock = threading.Lock()  # Serializes config swaps; readers never lock
         target_joints = target_joints or {self.config.joint}
         super().__init__("music", target_joints)
 
@@ -141,13 +151,32 @@ class MusicModifier(Modifier):
         self.energy_callback = callback
 
     def set_amplitude(self, amplitude: float):
-        self.config.amplitude = amplitude
+        self.set_params(amplitude=amplitude)
 
     def set_beat_divisor(self, divisor: float):
-        self.config.beat_divisor = max(0.25, divisor)
+        self.set_params(beat_divisor=divisor)
 
     def set_groove(self, groove: float):
-        self.config.groove = max(0.0, min(1.0, groove))
+        self.set_params(groove=groove)
+
+    def set_params(self, amplitude: Optional[float] = None, beat_divisor: Optional[float] = None,
+                   groove: Optional[float] = None):
+        """
+        Update amplitude, beat divisor and groove together.
+
+        Swaps in a new config object so the animation thread never sees a
+        half-updated state (new amplitude with old divisor). Swaps are
+        serialized so concurrent updates don't drop each other's fields.
+        """
+        changes = {}
+        if amplitude is not None:
+            changes["amplitude"] = amplitude
+        if beat_divisor is not None:
+            changes["beat_divisor"] = max(0.25, beat_divisor)
+        if groove is not None:
+            changes["groove"] = max(0.0, min(1.0, groove))
+        with self._config_lock:
+            self.config = replace(self.config, **changes)
 
     def update_target_joints(self, joints: Set[str]):
         self.target_joints = joints
@@ -202,34 +231,37 @@ class MusicModifier(Modifier):
         if self._envelope < 0.02:
             return 0.0
 
+        # Single read so a concurrent set_params() is seen all-or-nothing
+        config = self.config
+
         # Energy scaling
         energy = self._cached_energy
-        if energy < self.config.energy_threshold:
+        if energy < config.energy_threshold:
             energy_mult = 0.0
         else:
-            energy_mult = (energy - self.config.energy_threshold) / (1.0 - self.config.energy_threshold)
+            energy_mult = (energy - config.energy_threshold) / (1.0 - config.energy_threshold)
 
         if energy_mult < 0.02:
             return 0.0
 
         # Simple phase calculation
         elapsed = current_time - self._start_time
-        freq = (self._cached_bpm / 60.0) / self.config.beat_divisor
+        freq = (self._cached_bpm / 60.0) / config.beat_divisor
 
         # Joint phase offset for wave effect
         try:
             idx = self._joint_order.index(joint)
         except ValueError:
             idx = 0
-        phase = (elapsed * freq + idx * self.config.wave_spread) % 1.0
+        phase = (elapsed * freq + idx * config.wave_spread) % 1.0
 
         # Simple sine wave with optional groove
         wave = math.sin(phase * 2 * math.pi)
-        if self.config.groove > 0:
+        if config.groove > 0:
             # Add subtle bounce harmonic
-            wave += math.sin(phase * 4 * math.pi) * 0.1 * self.config.groove
+            wave += math.sin(phase * 4 * math.pi) * 0.1 * config.groove
 
-        return wave * self.config.amplitude * energy_mult * self._envelope
+        return wave * config.amplitude * energy_mult * self._envelope
 
 
 @dataclass
@@ -440,13 +472,18 @@ class ModifierStack:
         """List all modifiers and their enabled state."""
         return {name: mod.enabled for name, mod in self._modifiers.items()}
 
+    def enabled_names(self) -> List[str]:
+        """List the names of enabled modifiers."""
+        return [name for name, mod in self._modifiers.items() if mod.enabled]
+
     def apply(self, action: Dict[str, float]) -> Dict[str, float]:
         """Apply all enabled modifiers to an action."""
         current_time = time.time()
+        # One copy for the whole stack; each modifier adds its offsets in place
         result = action.copy()
 
         for modifier in self._modifiers.values():
             if modifier.enabled:
-                result = modifier.apply(result, current_time)
+                modifier.apply_inplace(result, current_time)
 
         return result
@@ -88,15 +88,15 @@ class MotorsService(ServiceBase):
             
             self.logger.info(f"Playing {len(actions)} actions from {recording_name}")
             
-            for row in actions:
-                t0 = time.perf_counter()
-                
+            # Each frame has an absolute deadline off one start time, so jitter does not accumulate
+            t0 = time.perf_counter()
+            for i, row in enumerate(actions, 1):
                 # Extract action data (exclude timestamp column)
                 action = {key: float(value) for key, value in row.items() if key != 'timestamp'}
                 self.robot.send_action(action)
                 
                 # Use time.sleep instead of busy_wait to avoid blocking other threads
-                sleep_time = 1.0 / self.fps - (time.perf_counter() - t0)
+                sleep_time = t0 + i / self.fps - time.perf_counter()
                 if sleep_time > 0:
                     time.sleep(sleep_time)
             
@@ -0,0 +1,56 @@
+import sys
+import os
+import logging
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from lelamp.service.emotion.emotion_service import Emotion, EmotionService
+
+
+@pytest.fixture
+def service():
+    # The keyword fast path needs no Gemini client, so skip __init__
+    service = EmotionService.__new__(EmotionService)
+    service.logger = logging.getLogger(__name__)
+    return service
+
+
+@pytest.mark.parametrize("text", [
+    "let's go to the kitchen",
+    "happy to help",
+    "i love it when you do that",
+    "happy birthday to my sister",
+    "awesome thanks",
+    "i wonder what time it is",
+    "glad you asked",
+    "great news everyone the package arrived",
+    "are you excited?",
+    "the movie was about a sad clown",
+    "i'm happy to help",
+    "the baby is crying",
+    "so what makes you angry",
+])
+def test_neutral_phrases_fall_through_to_gemini(service, text):
+    assert service._match_keywords(EmotionService._cache_key(text)) is None
+
+
+@pytest.mark.parametrize("text, emotion", [
+    ("Yay!", Emotion.HAPPY),
+    ("I'm so excited", Emotion.EXCITED),
+    ("I'm heartbroken", Emotion.SAD),
+    ("this is so frustrating, I'm furious", Emotion.ANGRY),
+    ("omg", Emotion.SURPRISED),
+    ("I'm so happy", Emotion.HAPPY),
+    ("im really sad today", Emotion.SAD),
+    ("I feel curious", Emotion.CURIOUS),
+])
+def test_unambiguous_keywords_classified_locally(service, text, emotion):
+    result = service._match_keywords(EmotionService._cache_key(text))
+    assert result is not None
+    assert result["emotion"] == emotion
+
+
+def test_negated_keywords_fall_through_to_gemini(service):
+    assert service._match_keywords(EmotionService._cache_key("I'm not sad")) is None
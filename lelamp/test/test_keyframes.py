@@ -0,0 +1,69 @@
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+pytest.importorskip("lerobot")
+
+from lelamp.service.motors.animation_service import AnimationService
+
+POSE = {
+    "base_yaw.pos": 50.0,
+    "base_pitch.pos": 50.0,
+    "elbow_pitch.pos": 50.0,
+    "wrist_roll.pos": 50.0,
+    "wrist_pitch.pos": 50.0,
+}
+
+
+class StubBus:
+    def sync_read(self, register):
+        return {joint[:-len(".pos")]: value for joint, value in POSE.items()}
+
+
+class StubRobot:
+    def __init__(self):
+        self.bus = StubBus()
+        self.sent = []
+
+    def send_action(self, action):
+        self.sent.append(dict(action))
+
+
+def test_partial_keyframes_hold_unlisted_joints():
+    service = AnimationService(port="stub", fps=10, duration=0.5)
+    service.robot = StubRobot()
+    service._load_recording = lambda name: [dict(POSE)]
+
+    actions = service._expand_keyframes([(0.0, {"base_yaw": 50.0}), (1.0, {"base_yaw": 80.0})])
+    service._handle_keyframes("yaw_only", actions)
+
+    # Interpolation in, keyframe frames, then the first frames back towards idle
+    for _ in range(len(actions) + 10):
+        service._continue_playback()
+
+    assert service.robot.sent
+    for action in service.robot.sent:
+        for joint in ("base_pitch.pos", "elbow_pitch.pos", "wrist_roll.pos", "wrist_pitch.pos"):
+            assert action[joint] == pytest.approx(50.0)
+    assert service._current_recording == "idle"
+
+
+def test_soa_keyframes_with_duplicate_times_match_list_form():
+    service = AnimationService(port="stub", fps=10)
+
+    listed = service._expand_keyframes([(0.0, {"base_yaw": 0.0}), (1.0, {"base_yaw": 10.0}), (1.0, {"base_yaw": 20.0})])
+    tracks = service._expand_keyframes({"base_yaw": ([0.0, 1.0, 1.0], [0.0, 10.0, 20.0])})
+
+    assert tracks == listed
+    assert tracks[-1]["base_yaw.pos"] == pytest.approx(20.0)
+
+
+def test_empty_soa_tracks_are_skipped():
+    service = AnimationService(port="stub", fps=10)
+
+    assert service._expand_keyframes({"base_yaw": ([], [])}) == []
+    actions = service._expand_keyframes({"base_yaw": ([], []), "base_pitch": ([0.0, 1.0], [0.0, 10.0])})
+    assert set(actions[0]) == {"base_pitch.pos"}
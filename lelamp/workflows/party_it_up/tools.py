@@ -1,5 +1,81 @@
 from livekit.agents import function_tool
 import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# Party themes to Spotify search queries, matched by substring in this order
+_SEARCH_QUERIES = (
+    # Birthday parties
+    ("birthday", "birthday party hits"),
+    ("kids birthday", "kids party music"),
+
+    # Holidays
+    ("christmas", "christmas party hits"),
+    ("new year", "new years eve party"),
+    ("new years eve", "new years eve party"),
+    ("halloween", "halloween party music"),
+    ("thanksgiving", "thanksgiving dinner music"),
+    ("valentine", "valentines day party"),
+    ("st patrick", "st patricks day party"),
+    ("easter", "easter celebration"),
+    ("fourth of july", "4th of july bbq hits"),
+
+    # Special occasions
+    ("graduation", "graduation party hits"),
+    ("wedding", "wedding reception music"),
+    ("baby shower", "baby shower music"),
+    ("retirement", "celebration hits"),
+
+    # Casual gatherings
+    ("casual", "chill party vibes"),
+    ("bbq", "summer bbq hits"),
+    ("pool party", "pool party mix"),
+    ("dinner party", "dinner party jazz"),
+    ("game night", "fun background music"),
+
+    # Dance parties
+    ("dance", "dance party hits"),
+    ("disco", "disco party classics"),
+    ("80s", "80s party hits"),
+    ("90s", "90s party mix"),
+
+    # Themed parties
+    ("tropical", "tropical party vibes"),
+    ("beach", "beach party hits"),
+    ("karaoke", "karaoke party hits"),
+    ("rock", "rock party anthems"),
+    ("country", "country party hits"),
+    ("latin", "latin party reggaeton"),
+)
+
+# Party themes to (animation, r, g, b, name, description), first entry with a matching keyword wins
+_THEME_ANIMATIONS = (
+    # Colorful rainbow party vibes
+    (("birthday", "celebration"), ("party", 255, 100, 200, "Party", "Colorful celebration mode with rainbow animations!")),
+    # Red and green alternating
+    (("christmas", "xmas"), ("pulse", 255, 0, 0, "Christmas party", "Festive red and green colors!")),
+    # Orange and purple spooky vibes
+    (("halloween",), ("ripple", 255, 100, 0, "Halloween party", "Spooky orange and purple vibes!")),
+    # Gold and silver sparkle
+    (("new year",), ("burst", 255, 215, 0, "New Year's party", "Sparkling gold celebration mode!")),
+    # Romantic red and pink
+    (("valentine",), ("pulse", 255, 20, 60, "Valentine's party", "Romantic red and pink glow!")),
+    # Green party vibes
+    (("st patrick", "irish"), ("wave", 0, 255, 0, "St. Patrick's party", "Lucky green vibes!")),
+    # Blue and turquoise ocean vibes
+    (("tropical", "beach", "pool"), ("wave", 0, 200, 255, "Tropical party", "Cool ocean blue waves!")),
+    # Multi-color strobe/party effect
+    (("dance", "disco"), ("party", 255, 0, 255, "Dance party", "Strobing multi-color disco vibes!")),
+)
+# Reply template for party_rgb_animation
+_LIGHTS_REPLY = "{name} lights activated! {description} {result}"
+# Default party animation - colorful and energetic
+_DEFAULT_THEME_ANIMATION = ("party", 255, 150, 0, "Party", "Energetic multi-color party mode!")
+
+# Backoff delays (seconds) when waiting for Spotify to report the new track, ~0.8s total
+_TRACK_POLL_DELAYS = (0.1, 0.15, 0.2, 0.35)
 
 
 @function_tool
@@ -14,7 +90,7 @@ async def play_party_music(self, party_theme: str) -> str:
     Returns:
         Confirmation that party music is now playing
     """
-    print(f"LeLamp: play_party_music called with theme={party_theme}")
+    logger.debug("play_party_music called with theme=%s", party_theme)
 
     # Try to call the agent's method if available
     if hasattr(self, 'play_party_music_internal'):
@@ -22,57 +98,8 @@ async def play_party_music(self, party_theme: str) -> str:
 
     theme_lower = party_theme.lower()
 
-    # Map party themes to Spotify search queries
-    search_queries = {
-        # Birthday parties
-        "birthday": "birthday party hits",
-        "kids birthday": "kids party music",
-
-        # Holidays
-        "christmas": "christmas party hits",
-        "new year": "new years eve party",
-        "new years eve": "new years eve party",
-        "halloween": "halloween party music",
-        "thanksgiving": "thanksgiving dinner music",
-        "valentine": "valentines day party",
-        "st patrick": "st patricks day party",
-        "easter": "easter celebration",
-        "fourth of july": "4th of july bbq hits",
-
-        # Special occasions
-        "graduation": "graduation party hits",
-        "wedding": "wedding reception music",
-        "baby shower": "baby shower music",
-        "retirement": "celebration hits",
-
-        # Casual gatherings
-        "casual": "chill party vibes",
-        "bbq": "summer bbq hits",
-        "pool party": "pool party mix",
-        "dinner party": "dinner party jazz",
-        "game night": "fun background music",
-
-        # Dance parties
-        "dance": "dance party hits",
-        "disco": "disco party classics",
-        "80s": "80s party hits",
-        "90s": "90s party mix",
-
-        # Themed parties
-        "tropical": "tropical party vibes",
-        "beach": "beach party hits",
-        "karaoke": "karaoke party hits",
-        "rock": "rock party anthems",
-        "country": "country party hits",
-        "latin": "latin party reggaeton",
-    }
-
     # Find best matching search query
-    search_query = None
-    for key, query in search_queries.items():
-        if key in theme_lower:
-            search_query = query
-            break
+    search_query = next((query for key, query in _SEARCH_QUERIES if key in theme_lower), None)
 
     # Default to general party music if no match
     if not search_query:
@@ -81,11 +108,20 @@ async def play_party_music(self, party_theme: str) -> str:
     # Try to play using Spotify service via self
     try:
         if hasattr(self, 'spotify_service') and self.spotify_service and hasattr(self.spotify_service, '_sp'):
-            success = self.spotify_service.play_search(search_query)
+            # Spotify calls block on HTTP round trips, keep them off the event loop
+            previous = await asyncio.to_thread(self.spotify_service.get_current_track)
+            previous_id = previous.get("id") if previous else None
+            success = await asyncio.to_thread(self.spotify_service.play_search, search_query)
             if success:
-                # Give it a moment to start
-                await asyncio.sleep(1)
-                track = self.spotify_service.get_current_track()
+                # Poll briefly for the new track instead of a fixed 1s wait; Spotify keeps
+                # reporting the previous song for a moment after play_search
+                track = None
+                for delay in _TRACK_POLL_DELAYS:
+                    await asyncio.sleep(delay)
+                    current = await asyncio.to_thread(self.spotify_service.get_current_track)
+                    if current and current.get("id") != previous_id:
+                        track = current
+                        break
                 if track:
                     return f"Party music started! Now playing: {track['name']} by {track['artist']}"
                 return f"Party music started! Playing {search_query}"
@@ -94,7 +130,7 @@ async def play_party_music(self, party_theme: str) -> str:
         else:
             return "Spotify is not connected. Please set up Spotify first to play party music."
     except Exception as e:
-        print(f"Error playing party music: {e}")
+        logger.error("Error playing party music: %s", e)
         return f"Error playing party music: {str(e)}"
 
 
@@ -110,55 +146,17 @@ async def party_rgb_animation(self, party_theme: str) -> str:
     Returns:
         Confirmation that party lighting has been activated
     """
-    print(f"LeLamp: party_rgb_animation called with theme={party_theme}")
+    logger.debug("party_rgb_animation called with theme=%s", party_theme)
 
     theme_lower = party_theme.lower()
 
     # Map themes to RGB animations and colors
-    if "birthday" in theme_lower or "celebration" in theme_lower:
-        # Colorful rainbow party vibes
-        result = await self.play_rgb_animation("party", 255, 100, 200)
-        return f"Party lights activated! Colorful celebration mode with rainbow animations! {result}"
-
-    elif "christmas" in theme_lower or "xmas" in theme_lower:
-        # Red and green alternating
-        result = await self.play_rgb_animation("pulse", 255, 0, 0)
-        return f"Christmas party lights activated! Festive red and green colors! {result}"
-
-    elif "halloween" in theme_lower:
-        # Orange and purple spooky vibes
-        result = await self.play_rgb_animation("ripple", 255, 100, 0)
-        return f"Halloween party lights activated! Spooky orange and purple vibes! {result}"
-
-    elif "new year" in theme_lower:
-        # Gold and silver sparkle
-        result = await self.play_rgb_animation("burst", 255, 215, 0)
-        return f"New Year's party lights activated! Sparkling gold celebration mode! {result}"
-
-    elif "valentine" in theme_lower:
-        # Romantic red and pink
-        result = await self.play_rgb_animation("pulse", 255, 20, 60)
-        return f"Valentine's party lights activated! Romantic red and pink glow! {result}"
-
-    elif "st patrick" in theme_lower or "irish" in theme_lower:
-        # Green party vibes
-        result = await self.play_rgb_animation("wave", 0, 255, 0)
-        return f"St. Patrick's party lights activated! Lucky green vibes! {result}"
-
-    elif "tropical" in theme_lower or "beach" in theme_lower or "pool" in theme_lower:
-        # Blue and turquoise ocean vibes
-        result = await self.play_rgb_animation("wave", 0, 200, 255)
-        return f"Tropical party lights activated! Cool ocean blue waves! {result}"
-
-    elif "dance" in theme_lower or "disco" in theme_lower:
-        # Multi-color strobe/party effect
-        result = await self.play_rgb_animation("party", 255, 0, 255)
-        return f"Dance party lights activated! Strobing multi-color disco vibes! {result}"
-
-    else:
-        # Default party animation - colorful and energetic
-        result = await self.play_rgb_animation("party", 255, 150, 0)
-        return f"Party lights activated! Energetic multi-color party mode! {result}"
+    animation, red, green, blue, name, description = next(
+        (entry for keywords, entry in _THEME_ANIMATIONS if any(k in theme_lower for k in keywords)),
+        _DEFAULT_THEME_ANIMATION
+    )
+    result = await self.play_rgb_animation(animation, red, green, blue)
+    return _LIGHTS_REPLY.format(name=name, description=description, result=result)
 
 
 @function_tool
@@ -169,7 +167,7 @@ async def party_start_sound_effect(self) -> str:
     Returns:
         Confirmation that the sound was played
     """
-    print("LeLamp: party_start_sound_effect called")
+    logger.debug("party_start_sound_effect called")
     try:
         result = await self.play_sound_effect("success")
         return f"Party kickoff sound played! {result}"
@@ -188,10 +186,51 @@ async def party_play_recording(self, recording_name: str) -> str:
     Returns:
         Confirmation that the recording is playing
     """
-    print(f"LeLamp: party_play_recording called with recording={recording_name}")
+    logger.debug("party_play_recording called with recording=%s", recording_name)
     try:
         result = await self.play_recording(recording_name)
         return result
     except Exception as e:
         return f"Error playing recording: {str(e)}"
 
+
+@function_tool
+async def party_kickoff(self, party_theme: str, recording_name: str = "excited") -> str:
+    """
+    Kick off the party all at once: start the themed music, the themed lights, the
+    kickoff sound effect and a dance move at the same time. Use this when it's party
+    time and you want everything going immediately.
+
+    Args:
+        party_theme: The type of party (e.g., "birthday", "christmas", "halloween")
+        recording_name: Name of the recording to dance with (e.g., "excited", "dancing1")
+
+    Returns:
+        Combined confirmation of music, lights, sound and movement
+    """
+    logger.debug("party_kickoff called with theme=%s, recording=%s", party_theme, recording_name)
+
+    # The four steps touch independent devices (Spotify, LEDs, speaker, motors),
+    # so run them concurrently; each blocking device call runs in a worker thread,
+    # so total time is the slowest step, not the sum
+    results = await asyncio.gather(
+        _unwrap(play_party_music)(self, party_theme),
+        _unwrap(party_rgb_animation)(self, party_theme),
+        _unwrap(party_start_sound_effect)(self),
+        _unwrap(party_play_recording)(self, recording_name),
+        return_exceptions=True
+    )
+
+    replies = []
+    for step, result in zip(("music", "lights", "sound", "moves"), results):
+        if isinstance(result, Exception):
+            logger.error("party_kickoff %s failed: %s", step, result)
+            replies.append(f"Couldn't start the {step}: {result}")
+        elif result:
+            replies.append(result)
+    return " ".join(replies)
+
+
+def _unwrap(tool):
+    """Get the plain coroutine function behind a function_tool"""
+    return getattr(tool, "__wrapped__", tool)
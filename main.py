@@ -147,6 +147,16 @@ def cleanup_services():
     except Exception as e:
         logging.error(f"Error stopping data collection service: {e}")
 
+    # Camera service (shared grabber used by vision tools)
+    try:
+        from lelamp.service.camera import get_camera_service
+        camera_service = get_camera_service()
+        if camera_service:
+            camera_service.stop()
+            logging.info("Camera service stopped")
+    except Exception as e:
+        logging.error(f"Error stopping camera service: {e}")
+
     logging.info("Cleanup complete")
 
 